@@ -1,11 +1,23 @@
 """
 Setup script for SQL2SPARQL
 """
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the SQL parser to a C extension with mypyc. The pure
+# Python module is always shipped and is used whenever no compiled build exists.
+ext_modules = []
+if os.environ.get("SQL2SPARQL_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--disable-error-code=annotation-unchecked", "sql2sparql/parsers/sql_parser.py"]
+    )
+
 setup(
     name="sql2sparql",
     version="1.0.0",
@@ -43,6 +55,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
@@ -62,5 +75,6 @@ setup(
         ],
     },
     include_package_data=True,
+    ext_modules=ext_modules,
     zip_safe=False,
 )
\ No newline at end of file
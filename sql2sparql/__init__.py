@@ -8,13 +8,14 @@ enabling SQL users to query RDF data without conversion to relational format.
 __version__ = "1.0.0"
 __author__ = "SQL2SPARQL Team"
 
-from .core.converter import SQL2SPARQLConverter
+from .core.converter import SQL2SPARQLConverter, CompiledQuery
 from .core.schema_mapper import SchemaMapper
 from .executors.sparql_executor import SPARQLExecutor
 from .core.models import SQLQuery, SPARQLQuery, Triple, Attribute
 
 __all__ = [
     "SQL2SPARQLConverter",
+    "CompiledQuery",
     "SchemaMapper", 
     "SPARQLExecutor",
     "SQLQuery",
@@ -2,8 +2,12 @@
 GROUP BY and HAVING Converters - Converts SQL GROUP BY and HAVING clauses to SPARQL
 Based on algorithms from Tables XI (ConvSqlGroupBy) and XII (ConvSqlHaving) in the paper
 """
+import re
 from typing import List, Dict, Tuple, Optional
 from ..core.models import Attribute, Triple, WhereCondition, AggregateFunction
+from ..utils.iri import iri_ref
+
+_VARIABLE_RE = re.compile(r'\?(\w+)')
 
 
 class GroupHavingConverter:
@@ -193,8 +197,7 @@ class GroupHavingConverter:
                         # using the base variable, not the SELECT alias
                         if 'AS' in object_var and '(' in object_var:
                             # Extract base variable from SELECT expression
-                            import re
-                            match = re.search(r'\?(\w+)', object_var)
+                            match = _VARIABLE_RE.search(object_var)
                             base_var = match.group(0) if match else object_var
                             agg_expr = self._build_aggregate_expr(
                                 base_var, attr.aggregate
@@ -324,9 +327,9 @@ class GroupHavingConverter:
             Predicate URI string
         """
         if self.schema_mapper:
-            return f"<http://example.org/ontology/{attribute_name}>"
+            return iri_ref(f"http://example.org/ontology/{attribute_name}")
         else:
-            return f"<http://example.org/ontology/{attribute_name}>"
+            return iri_ref(f"http://example.org/ontology/{attribute_name}")
 
     def _get_type_uri(self, relation_name: str) -> str:
         """
@@ -339,6 +342,6 @@ class GroupHavingConverter:
             Type URI string
         """
         if self.schema_mapper:
-            return f"<http://example.org/types/{relation_name.title()}>"
+            return iri_ref(f"http://example.org/types/{relation_name.title()}")
         else:
-            return f"<http://example.org/types/{relation_name.title()}>"
+            return iri_ref(f"http://example.org/types/{relation_name.title()}")
@@ -5,6 +5,8 @@ Based on algorithms from Tables XIII-XV in the paper
 from typing import List, Dict, Any, Tuple, Optional
 import uuid
 from ..core.models import Triple, WhereCondition
+from .where_converter import WhereConverter
+from ..utils.iri import iri_ref
 
 
 class InsertDeleteConverter:
@@ -201,9 +203,9 @@ class InsertDeleteConverter:
         """
         if self.schema_mapper:
             # Use schema mapper if available
-            return f"<{self.base_uri}ontology/{attribute_name}>"
+            return iri_ref(f"{self.base_uri}ontology/{attribute_name}")
         else:
-            return f"<{self.base_uri}ontology/{attribute_name}>"
+            return iri_ref(f"{self.base_uri}ontology/{attribute_name}")
 
     def _get_type_uri(self, table_name: str) -> str:
         """
@@ -216,9 +218,9 @@ class InsertDeleteConverter:
             Type URI string
         """
         if self.schema_mapper:
-            return f"<{self.base_uri}types/{table_name.title()}>"
+            return iri_ref(f"{self.base_uri}types/{table_name.title()}")
         else:
-            return f"<{self.base_uri}types/{table_name.title()}>"
+            return iri_ref(f"{self.base_uri}types/{table_name.title()}")
 
     def _format_value(self, value: Any) -> str:
         """
@@ -288,8 +290,7 @@ class InsertDeleteConverter:
         sparql_op = operator_map.get(operator.upper(), operator)
 
         if sparql_op == 'regex':
-            # Convert SQL LIKE to SPARQL regex
-            pattern = value.replace('%', '.*').replace('_', '.')
-            return f'regex({variable}, "{pattern}", "i")'
+            # Convert SQL LIKE the same way SELECT's WHERE clause does
+            return WhereConverter.build_like_filter(variable, str(value))
         else:
             return f"{variable} {sparql_op} {formatted_value}"
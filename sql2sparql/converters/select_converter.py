@@ -4,6 +4,7 @@ Based on algorithm from Table X (exConvSqlSelect) in the paper
 """
 from typing import List, Dict, Tuple, Optional
 from ..core.models import Attribute, Triple, AggregateFunction
+from ..utils.iri import iri_ref
 
 
 class SelectConverter:
@@ -125,10 +126,10 @@ class SelectConverter:
         if self.schema_mapper:
             # Use schema mapper if available
             predicate_uri = self.schema_mapper.get_column_property(attribute_name)
-            return f"<{predicate_uri}>"
+            return iri_ref(predicate_uri)
         else:
             # Default namespace
-            return f"<http://example.org/ontology/{attribute_name}>"
+            return iri_ref(f"http://example.org/ontology/{attribute_name}")
 
     def _get_type_uri(self, relation_name: str) -> str:
         """
@@ -143,10 +144,10 @@ class SelectConverter:
         if self.schema_mapper:
             # Use schema mapper if available
             type_uri = self.schema_mapper.get_table_class(relation_name)
-            return f"<{type_uri}>"
+            return iri_ref(type_uri)
         else:
             # Default type namespace
-            return f"<http://example.org/types/{relation_name.title()}>"
+            return iri_ref(f"http://example.org/types/{relation_name.title()}")
 
     def get_triple_patterns(self) -> List[Triple]:
         """
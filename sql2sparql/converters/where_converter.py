@@ -2,10 +2,26 @@
 WHERE Clause Converter - Converts SQL WHERE clauses to SPARQL
 Based on algorithm from Table VIII (ConvSqlWhere) in the paper
 """
+import re
 from typing import List, Dict, Tuple, Optional, Any
 from ..core.models import (
     WhereCondition, JoinCondition, Triple
 )
+from ..utils.iri import iri_ref
+from ..utils.literals import sparql_string
+
+_COLUMN_NAME_RE = re.compile(r'\b([a-zA-Z_]\w*)\b')
+
+# Translates a LIKE pattern to a regex inside a SPARQL string in one pass: the
+# wildcards become .* and ., regex metacharacters are escaped, and backslashes
+# and quotes are escaped again for the enclosing string literal
+_LIKE_REGEX_TABLE = str.maketrans({
+    '%': '.*',
+    '_': '.',
+    '\\': '\\\\\\\\',
+    '"': '\\"',
+    **{char: '\\\\' + char for char in '.^$*+?{}[]|()'},
+})
 
 
 class WhereConverter:
@@ -210,8 +226,7 @@ class WhereConverter:
                     expr_content = attr.name.strip('() ')
 
                     # Extract column names from the expression first
-                    import re
-                    column_names = re.findall(r'\b([a-zA-Z_]\w*)\b', expr_content)
+                    column_names = _COLUMN_NAME_RE.findall(expr_content)
 
                     # Create variable mappings for the expression
                     var_mappings = {}
@@ -285,9 +300,9 @@ class WhereConverter:
         if self.schema_mapper:
             # Use schema mapper if available
             predicate_uri = self.schema_mapper.get_column_property(attribute_name)
-            return f"<{predicate_uri}>"
+            return iri_ref(predicate_uri)
         else:
-            return f"<http://example.org/ontology/{attribute_name}>"
+            return iri_ref(f"http://example.org/ontology/{attribute_name}")
 
     def _get_type_uri(self, relation_name: str) -> str:
         """
@@ -302,9 +317,41 @@ class WhereConverter:
         if self.schema_mapper:
             # Use schema mapper if available
             type_uri = self.schema_mapper.get_table_class(relation_name)
-            return f"<{type_uri}>"
+            return iri_ref(type_uri)
         else:
-            return f"<http://example.org/types/{relation_name.title()}>"
+            return iri_ref(f"http://example.org/types/{relation_name.title()}")
+
+    @staticmethod
+    def build_like_filter(variable: str, pattern: str) -> str:
+        """
+        Build a case-insensitive SPARQL expression for SQL LIKE
+
+        Prefix, suffix and substring patterns ('abc%', '%abc', '%abc%') become
+        STRSTARTS/STRENDS/CONTAINS on the lower-cased value, which run in linear
+        time. Any other pattern falls back to regex(), anchored at both ends since
+        LIKE matches the whole value.
+
+        Args:
+            variable: Variable name
+            pattern: LIKE pattern without quotes, with quotes still doubled ('')
+
+        Returns:
+            SPARQL expression string
+        """
+        if '_' not in pattern:
+            leading = pattern.startswith('%')
+            trailing = len(pattern) > 1 and pattern.endswith('%')
+            needle = pattern[1 if leading else 0:-1 if trailing else len(pattern)]
+            if (leading or trailing) and '%' not in needle:
+                needle = sparql_string(needle.lower())
+                if leading and trailing:
+                    return f'CONTAINS(LCASE({variable}), {needle})'
+                if trailing:
+                    return f'STRSTARTS(LCASE({variable}), {needle})'
+                return f'STRENDS(LCASE({variable}), {needle})'
+
+        regex_pattern = pattern.replace("''", "'").translate(_LIKE_REGEX_TABLE)
+        return f'regex({variable}, "^{regex_pattern}$", "i")'
 
     def _build_filter_expression(self, variable: str, operator: str, value: Any) -> str:
         """
@@ -325,8 +372,8 @@ class WhereConverter:
                 float(value)
                 value_str = value
             except ValueError:
-                # String literal - add quotes
-                value_str = f'"{value}"'
+                # String literal - quote and escape for SPARQL
+                value_str = sparql_string(value)
         else:
             value_str = str(value)
 
@@ -345,10 +392,9 @@ class WhereConverter:
         sparql_op = operator_map.get(operator.upper(), operator)
 
         if sparql_op == 'regex':
-            # Convert SQL LIKE to SPARQL regex
+            # Convert SQL LIKE to a SPARQL string function or regex
             if value is not None:
-                pattern = str(value).replace('%', '.*').replace('_', '.')
-                return f'regex({variable}, "{pattern}", "i")'
+                return self.build_like_filter(variable, str(value))
             else:
                 return f'regex({variable}, ".*", "i")'
         else:
@@ -10,8 +10,9 @@ Enhanced with support for:
 - Proper UNION/INTERSECT/EXCEPT support
 - Expression builder for complex calculations
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Pattern, Sequence, Tuple
 from dataclasses import dataclass
+import functools
 import re
 
 from ..parsers.sql_parser import SQLParser
@@ -19,22 +20,99 @@ from ..converters.select_converter import SelectConverter
 from ..converters.where_converter import WhereConverter
 from ..converters.group_having_converter import GroupHavingConverter
 from ..converters.insert_delete_converter import InsertDeleteConverter
-from .models import SQLQuery, SPARQLQuery, QueryType, CombinationType, Triple
+from .models import SQLQuery, SPARQLQuery, QueryType, CombinationType, Triple, _SLOTS
 from .schema_mapper import SchemaMapper
-
-
-@dataclass
+from ..utils.iri import iri_ref
+from ..utils.literals import sparql_string
+
+# Patterns are compiled once at import time rather than on every conversion
+_DECIMAL_RE = re.compile(r'^\d+\.\d+$')
+_DECIMAL_LITERAL_RE = re.compile(r'\b\d+\.\d+\b')
+_QUALIFIED_COLUMN_RE = re.compile(r'\b(\w+\.\w+)\b')
+_WORD_RE = re.compile(r'\b(\w+)\b')
+_LIMIT_RE = re.compile(r'LIMIT\s+(\d+)', re.IGNORECASE)
+_UNION_ORDER_BY_RE = re.compile(r'\s+ORDER\s+BY\s+(.*?)(?:\s+LIMIT|\s*$)', re.IGNORECASE)
+_UNION_LIMIT_RE = re.compile(r'\s+LIMIT\s+(\d+)', re.IGNORECASE)
+_UNION_RE = re.compile(r'\s*\bUNION(?:\s+ALL)?\b\s*', re.IGNORECASE)
+_SPARQL_WHERE_RE = re.compile(r'WHERE \{(.*?)\}', re.DOTALL)
+_SPARQL_SELECT_RE = re.compile(r'SELECT (.*)WHERE', re.DOTALL)
+_AS_SPLIT_RE = re.compile(r'\s+AS\s+', re.IGNORECASE)
+_AGG_CALL_RE = re.compile(r'(\w+)\((.*)\)', re.IGNORECASE)
+_ALIAS_RE = re.compile(r'\s+as\s+(\w+)', re.IGNORECASE)
+_BETWEEN_RANGE_RE = re.compile(r'(\S+)\s+AND\s+(\S+)', re.IGNORECASE)
+# WHERE lexemes: quoted strings, parentheses and runs of other non-space text
+_WHERE_LEXEME_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|[()]|[^\s'\"()]+")
+# Boolean operator precedence for WHERE clauses; NOT is a prefix operator
+_BOOLEAN_PRECEDENCE = {'OR': 1, 'AND': 2, 'NOT': 3}
+# One WHERE predicate, classified in a single match and dispatched on lastgroup.
+# Alternatives are tried in order: [NOT] BETWEEN ranges must span the whole
+# predicate, arithmetic comparisons need an operator somewhere in the text, and
+# anything else is a plain column comparison.
+_PREDICATE_RE = re.compile(
+    r'(?P<not_between>(?P<nb_col>\w+(?:\.\w+)?)\s+NOT\s+BETWEEN\s+(?P<nb_lower>\S+)'
+    r'\s+AND\s+(?P<nb_upper>\S+)\Z)'
+    r'|(?P<between>(?P<b_col>\w+(?:\.\w+)?)\s+BETWEEN\s+(?P<b_lower>\S+)'
+    r'\s+AND\s+(?P<b_upper>\S+)\Z)'
+    r'|(?P<expression>(?=.*[-+*/])\((?P<e_expr>.*?)\)\s*(?P<e_op>[><=]+)\s*(?P<e_value>\d+))'
+    r'|(?P<comparison>(?P<c_col>\w+(?:\.\w+)?)\s*'
+    r'(?P<c_op>=|!=|<>|<|>|<=|>=|NOT\s+LIKE|NOT\s+IN|LIKE|IN|BETWEEN)\s+(?P<c_value>.+))',
+    re.IGNORECASE
+)
+# Comments and runs of whitespace outside quoted literals; both are layout only and
+# collapse to a single space. Comments must go too, since a '--' comment would
+# otherwise swallow everything after its line break.
+_LAYOUT_RE = re.compile(r"('(?:[^']|'')*'|\"[^\"]*\")|(?:--[^\n]*|/\*.*?\*/|\s)+", re.S)
+_SPARQL_COMPARISON_OPS = {'=': '=', '!=': '!=', '<>': '!='}
+# IN list items: quoted strings, whole numbers, or any other bare token
+_IN_VALUE_RE = re.compile(
+    r"'(?P<single>(?:[^']|'')*)'|\"(?P<double>[^\"]*)\""
+    r"|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?=\s*(?:,|$))"
+    r"|(?P<bare>[^,\s](?:[^,]*[^,\s])?)"
+)
+_HAVING_COUNT_RE = re.compile(r'COUNT\((.*)\)\s*([><=]+)\s*(\d+)', re.IGNORECASE)
+
+# Clause patterns are built from keyword lists, so they are compiled on first use
+_CLAUSE_RE_CACHE: Dict[Tuple[str, str], Pattern[str]] = {}
+
+# Non-zero integer literals that are not part of a name or a decimal. These are the
+# only literals abstracted out of a query shape: string contents take part in
+# keyword sniffing and number detection, and zero can switch a clause off.
+_SHAPE_LITERAL_RE = re.compile(r'(?<![\w.])[1-9]\d*(?![\w.])')
+_SHAPE_PROBE_BASES = (90731, 81647)
+_SHAPE_SPECIALIZE_AFTER = 3
+_SHAPE_TABLE_LIMIT = 512
+# Leading INSERT keyword; a whole word, so "Inserting ..." is not an INSERT
+_INSERT_PREFIX_RE = re.compile(r'INSERT\b', re.IGNORECASE)
+# '?' placeholders of prepared queries; quoted literals are matched only to skip them
+_PLACEHOLDER_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|\?")
+
+
+# Expression tokens: numbers, quoted strings, (dotted) names, operators and punctuation
+_EXPR_TOKEN_RE = re.compile(
+    r"\s*(?:(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<str>'(?:[^']|'')*'|\"[^\"]*\")"
+    r"|(?P<name>[A-Za-z_]\w*(?:\.\w+)*)"
+    r"|(?P<op>[-+*/])|(?P<lparen>\()|(?P<rparen>\))|(?P<comma>,))"
+)
+# Binary operator precedence; all operators are left-associative
+_EXPR_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+_AGGREGATE_FUNCTIONS = frozenset(['COUNT', 'SUM', 'AVG', 'MIN', 'MAX'])
+
+
+class _ExpressionSyntaxError(ValueError):
+    """Raised internally when an expression cannot be tokenized or parsed"""
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ExpressionNode:
-    """Node for expression tree representation"""
+    """Node for expression tree representation (read-only; parsed trees are shared)"""
     type: str  # 'operator', 'operand', 'function', 'literal'
     value: Any
     left: Optional['ExpressionNode'] = None
     right: Optional['ExpressionNode'] = None
-    arguments: Optional[List['ExpressionNode']] = None
-    
-    def __post_init__(self):
-        if self.arguments is None:
-            self.arguments = []
+    # Function arguments; a tuple so shared trees stay immutable and argument-free
+    # nodes need no allocation of their own
+    arguments: Tuple['ExpressionNode', ...] = ()
 
 
 class ExpressionBuilder:
@@ -43,96 +121,302 @@ class ExpressionBuilder:
     def __init__(self):
         self.temp_var_counter = 0
 
-    def parse_expression(self, expr_str: str) -> ExpressionNode:
-        """Parse SQL expression into expression tree"""
-        expr_str = expr_str.strip()
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def parse_expression(expr_str: str) -> ExpressionNode:
+        """
+        Parse SQL expression into expression tree
 
-        # Check for parentheses and handle them first
-        if expr_str.startswith('(') and expr_str.endswith(')'):
-            expr_str = expr_str[1:-1].strip()
-
-        # Check for arithmetic operators (handle them from lowest to highest precedence)
-        for op in ['+', '-', '*', '/']:
-            # Find the operator not within parentheses
-            paren_depth = 0
-            for i, char in enumerate(expr_str):
-                if char == '(':
-                    paren_depth += 1
-                elif char == ')':
-                    paren_depth -= 1
-                elif char == op and paren_depth == 0:
-                    left = expr_str[:i].strip()
-                    right = expr_str[i+1:].strip()
-                    if left and right:  # Make sure both sides exist
-                        return ExpressionNode(
-                            type='operator',
-                            value=op,
-                            left=self.parse_expression(left),
-                            right=self.parse_expression(right)
-                        )
-
-        # Check for function calls
-        func_match = re.match(r'(\w+)\((.*?)\)', expr_str)
-        if func_match:
-            func_name = func_match.group(1)
-            args_str = func_match.group(2)
-            args = [self.parse_expression(arg.strip()) for arg in args_str.split(',') if arg.strip()]
-            return ExpressionNode(type='function', value=func_name.upper(), arguments=args)
-
-        # Check if it's a table.column reference
-        if '.' in expr_str and not re.match(r'^\d+\.\d+$', expr_str):  # Not a decimal number
-            parts = expr_str.split('.')
-            if len(parts) == 2:
-                return ExpressionNode(type='operand', value={'table': parts[0], 'column': parts[1]})
-
-        # Check if it's a number (including decimals)
+        Trees are memoized on the expression text and shared between callers,
+        so they must not be modified.
+        """
+        expr_str = expr_str.strip()
         try:
-            float(expr_str)
-            return ExpressionNode(type='literal', value=expr_str)
-        except ValueError:
-            # It's either a column name or string literal
-            if expr_str.startswith("'") or expr_str.startswith('"'):
-                return ExpressionNode(type='literal', value=expr_str)
-            else:
-                # Simple column name
-                return ExpressionNode(type='operand', value={'column': expr_str})
+            return _ExpressionParser(expr_str).parse()
+        except _ExpressionSyntaxError:
+            # Text outside the arithmetic grammar is kept whole as a single leaf
+            return _parse_leaf(expr_str)
 
     def to_sparql_expression(self, node: ExpressionNode, var_mappings: Dict) -> str:
         """Convert expression tree to SPARQL expression"""
-        if node.type == 'operator':
-            left_expr = self.to_sparql_expression(node.left, var_mappings) if node.left else "NULL"
-            right_expr = self.to_sparql_expression(node.right, var_mappings) if node.right else "NULL"
-            return f"({left_expr} {node.value} {right_expr})"
-
-        elif node.type == 'operand':
-            if isinstance(node.value, dict):
-                if 'table' in node.value and 'column' in node.value:
-                    key = f"{node.value['table']}.{node.value['column']}"
-                    if key in var_mappings:
-                        return var_mappings[key]
-                    return f"?{node.value['column'].lower()}"
-                elif 'column' in node.value:
-                    col_name = node.value['column']
-                    # First try exact match
-                    if col_name in var_mappings:
-                        return var_mappings[col_name]
-                    # Then try with table prefix
-                    for key, var in var_mappings.items():
-                        if key.endswith(f".{col_name}"):
-                            return var
-                    return f"?{col_name.lower()}"
-
-        elif node.type == 'literal':
-            return str(node.value)
-
-        elif node.type == 'function':
-            if node.value in ['COUNT', 'SUM', 'AVG', 'MIN', 'MAX']:
-                if node.arguments:
-                    arg_expr = self.to_sparql_expression(node.arguments[0], var_mappings)
-                    return f"{node.value}({arg_expr})"
-                return f"{node.value}(*)"
-
-        return "?unknown"
+        return _ExpressionRenderer(var_mappings).render(node)
+
+
+def _parse_leaf(expr_str: str) -> ExpressionNode:
+    """Classify operator-free text as a column reference or a literal"""
+    # Check if it's a table.column reference
+    if '.' in expr_str and not _DECIMAL_RE.match(expr_str):  # Not a decimal number
+        parts = expr_str.split('.')
+        if len(parts) == 2:
+            return ExpressionNode(type='operand', value={'table': parts[0], 'column': parts[1]})
+
+    # Check if it's a number (including decimals)
+    try:
+        float(expr_str)
+        return ExpressionNode(type='literal', value=expr_str)
+    except ValueError:
+        # It's either a column name or string literal
+        if expr_str.startswith("'") or expr_str.startswith('"'):
+            return ExpressionNode(type='literal', value=expr_str)
+        else:
+            # Simple column name
+            return ExpressionNode(type='operand', value={'column': expr_str})
+
+
+class _ExpressionRenderer:
+    """
+    Renders one expression tree against a fixed column-to-variable mapping
+
+    Unqualified columns without an exact mapping resolve to the first
+    table-qualified key ending in that column. The suffix index for that lookup
+    is built at most once per rendering instead of scanning every key per node.
+    """
+
+    def __init__(self, var_mappings: Dict[str, str]):
+        self.var_mappings = var_mappings
+        self._column_index: Optional[Dict[str, str]] = None
+
+    def render(self, node: ExpressionNode) -> str:
+        handler = _RENDER_HANDLERS.get(node.type)
+        result = handler(self, node) if handler else None
+        return "?unknown" if result is None else result
+
+    def _render_operator(self, node: ExpressionNode) -> str:
+        left_expr = self.render(node.left) if node.left else "NULL"
+        right_expr = self.render(node.right) if node.right else "NULL"
+        return f"({left_expr} {node.value} {right_expr})"
+
+    def _render_operand(self, node: ExpressionNode) -> Optional[str]:
+        if not isinstance(node.value, dict) or 'column' not in node.value:
+            return None
+        col_name = node.value['column']
+        if 'table' in node.value:
+            key = f"{node.value['table']}.{col_name}"
+            return self.var_mappings.get(key, f"?{col_name.lower()}")
+
+        # First try exact match
+        if col_name in self.var_mappings:
+            return self.var_mappings[col_name]
+        # Then try with table prefix
+        if '.' in col_name:
+            for key, var in self.var_mappings.items():
+                if key.endswith(f".{col_name}"):
+                    return var
+        else:
+            if self._column_index is None:
+                self._column_index = {}
+                for key, var in self.var_mappings.items():
+                    if '.' in key:
+                        self._column_index.setdefault(key.rsplit('.', 1)[1], var)
+            if col_name in self._column_index:
+                return self._column_index[col_name]
+        return f"?{col_name.lower()}"
+
+    def _render_literal(self, node: ExpressionNode) -> str:
+        return str(node.value)
+
+    def _render_function(self, node: ExpressionNode) -> Optional[str]:
+        if node.value not in _AGGREGATE_FUNCTIONS:
+            return None
+        if node.arguments:
+            return f"{node.value}({self.render(node.arguments[0])})"
+        return f"{node.value}(*)"
+
+
+# Node type -> unbound render method, shared by every renderer instance
+_RENDER_HANDLERS = {
+    'operator': _ExpressionRenderer._render_operator,
+    'operand': _ExpressionRenderer._render_operand,
+    'literal': _ExpressionRenderer._render_literal,
+    'function': _ExpressionRenderer._render_function,
+}
+
+
+class _ExpressionParser:
+    """
+    Precedence-climbing parser for SQL arithmetic expressions
+
+    The text is tokenized once up front; parsing is then a single left-to-right
+    pass over the tokens, so nested and chained operators cost linear time.
+    """
+
+    def __init__(self, expr_str: str):
+        self.tokens = self._tokenize(expr_str)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(expr_str: str) -> List[Tuple[str, str]]:
+        """Split an expression into (kind, text) tokens"""
+        tokens: List[Tuple[str, str]] = []
+        pos = 0
+        end = len(expr_str.rstrip())
+        while pos < end:
+            match = _EXPR_TOKEN_RE.match(expr_str, pos)
+            if match is None or match.lastgroup is None or match.end() == pos:
+                raise _ExpressionSyntaxError(expr_str)
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        return tokens
+
+    def parse(self) -> ExpressionNode:
+        """Parse the whole expression"""
+        node = self._parse_binary(1)
+        if self.pos != len(self.tokens):
+            raise _ExpressionSyntaxError(self.tokens[self.pos][1])
+        return node
+
+    def _peek(self) -> Tuple[str, str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return ('end', '')
+
+    def _expect(self, kind: str) -> str:
+        token_kind, text = self._peek()
+        if token_kind != kind:
+            raise _ExpressionSyntaxError(text)
+        self.pos += 1
+        return text
+
+    def _parse_binary(self, min_precedence: int) -> ExpressionNode:
+        """Parse operators binding at least as tightly as min_precedence"""
+        left = self._parse_unary()
+        while True:
+            kind, op = self._peek()
+            precedence = _EXPR_PRECEDENCE.get(op, 0) if kind == 'op' else 0
+            if precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self._parse_binary(precedence + 1)
+            left = ExpressionNode(type='operator', value=op, left=left, right=right)
+
+    def _parse_unary(self) -> ExpressionNode:
+        """Parse an atom with optional leading signs"""
+        kind, op = self._peek()
+        if kind == 'op' and op in '+-':
+            self.pos += 1
+            # A signed number stays a single literal, e.g. -5
+            next_kind, number = self._peek()
+            if next_kind == 'num':
+                self.pos += 1
+                return ExpressionNode(type='literal', value=op + number)
+            operand = self._parse_unary()
+            if op == '+':
+                return operand
+            return ExpressionNode(
+                type='operator', value='*', left=ExpressionNode(type='literal', value='-1'),
+                right=operand
+            )
+        return self._parse_atom()
+
+    def _parse_atom(self) -> ExpressionNode:
+        """Parse a literal, a column reference, a function call or a parenthesized group"""
+        kind, text = self._peek()
+        self.pos += 1
+        if kind in ('num', 'str'):
+            return ExpressionNode(type='literal', value=text)
+        if kind == 'lparen':
+            node = self._parse_binary(1)
+            self._expect('rparen')
+            return node
+        if kind != 'name':
+            raise _ExpressionSyntaxError(text)
+
+        if self._peek()[0] == 'lparen':
+            self.pos += 1
+            return ExpressionNode(type='function', value=text.upper(), arguments=self._parse_arguments())
+
+        # Adjacent names (e.g. DISTINCT col) stay together as one column, as before
+        while self._peek()[0] == 'name':
+            text = f"{text} {self._peek()[1]}"
+            self.pos += 1
+        return _parse_leaf(text)
+
+    def _parse_arguments(self) -> Tuple[ExpressionNode, ...]:
+        """Parse a function argument list after its opening parenthesis"""
+        arguments: List[ExpressionNode] = []
+        if self._peek()[0] == 'rparen':
+            self.pos += 1
+            return ()
+        while True:
+            if self._peek() == ('op', '*') and self.tokens[self.pos + 1:self.pos + 2] in (
+                [('rparen', ')')], [('comma', ',')]
+            ):
+                self.pos += 1
+                arguments.append(ExpressionNode(type='operand', value={'column': '*'}))
+            else:
+                arguments.append(self._parse_binary(1))
+            if self._peek()[0] == 'comma':
+                self.pos += 1
+                continue
+            self._expect('rparen')
+            return tuple(arguments)
+
+
+def _sql_literal(value: Any) -> str:
+    """Render a prepared-query parameter as a SQL literal"""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise TypeError(f"Unsupported parameter type: {type(value).__name__}")
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+def _normalize_layout(sql_query: str) -> str:
+    """Drop comments and collapse whitespace outside quoted literals"""
+    return _LAYOUT_RE.sub(lambda m: m.group(1) or ' ', sql_query).strip()
+
+
+class CompiledQuery:
+    """
+    A SQL query with '?' placeholders, prepared for repeated conversion
+
+    Created by SQL2SPARQLConverter.prepare(). Positive integer parameters are
+    filled straight into a SPARQL template built at prepare time; any other
+    values are inlined into the SQL, which is then converted as usual.
+    """
+
+    __slots__ = ('converter', 'sql_parts', 'template', 'schema_version')
+
+    def __init__(
+        self,
+        converter: 'SQL2SPARQLConverter',
+        sql_parts: Tuple[str, ...],
+        template: Optional[str],
+        schema_version: int
+    ):
+        self.converter = converter
+        self.sql_parts = sql_parts
+        self.template = template
+        self.schema_version = schema_version
+
+    @property
+    def parameter_count(self) -> int:
+        """Number of '?' placeholders in the query"""
+        return len(self.sql_parts) - 1
+
+    def execute(self, params: Sequence[Any] = ()) -> str:
+        """
+        Produce the SPARQL query for one set of parameter values
+
+        Args:
+            params: One int, float or str value per placeholder, in order
+
+        Returns:
+            SPARQL query string
+        """
+        if len(params) != self.parameter_count:
+            raise ValueError(
+                f"Expected {self.parameter_count} parameters, got {len(params)}"
+            )
+        literals = [_sql_literal(value) for value in params]
+
+        if (
+            self.template is not None
+            and self.schema_version == self.converter._schema_version()
+            and all(_SHAPE_LITERAL_RE.fullmatch(literal) for literal in literals)
+        ):
+            return self.template.format(*literals)
+        return self.converter.convert(SQL2SPARQLConverter._fill_shape(self.sql_parts, literals))
 
 
 class SQL2SPARQLConverter:
@@ -156,6 +440,13 @@ class SQL2SPARQLConverter:
         self.insert_delete_converter = InsertDeleteConverter(schema_mapper)
         self.expression_builder = ExpressionBuilder()
         self.var_mappings: Dict[str, str] = {}  # Track variable mappings for complex queries
+        self.calc_alias_counter = 0  # Numbers unaliased calculated columns within a query
+        # Results are keyed on the query text and the schema version they were built against
+        self._convert_cached = functools.lru_cache(maxsize=512)(self._convert_versioned)
+        # Query shapes (SQL with integer literals abstracted) seen so far, and the
+        # SPARQL templates built for shapes that keep recurring
+        self._shape_counts: Dict[Tuple[Tuple[str, ...], int], int] = {}
+        self._shape_templates: Dict[Tuple[Tuple[str, ...], int], Optional[str]] = {}
 
     def convert(self, sql_query: str) -> str:
         """
@@ -167,13 +458,177 @@ class SQL2SPARQLConverter:
         Returns:
             SPARQL query string
         """
-        # Check for UNION/INTERSECT/EXCEPT first
-        if 'UNION' in sql_query.upper():
+        # Layout-only differences (indentation, line breaks, comments) share one cache entry
+        sql_query = _normalize_layout(sql_query)
+
+        # INSERT mints a new subject IRI on every call, so it is never served from the cache
+        if _INSERT_PREFIX_RE.match(sql_query):
+            return self._convert_uncached(sql_query)
+
+        return self._convert_cached(sql_query, self._schema_version())
+
+    def prepare(self, sql_query: str) -> CompiledQuery:
+        """
+        Prepare a SQL query with '?' placeholders for repeated conversion
+
+        Args:
+            sql_query: SQL query string; '?' outside quoted literals marks a parameter
+
+        Returns:
+            CompiledQuery whose execute(params) returns the SPARQL query string
+        """
+        sql_query = _normalize_layout(sql_query.strip())
+
+        sql_parts = []
+        start = 0
+        for match in _PLACEHOLDER_RE.finditer(sql_query):
+            if match.group() == '?':
+                sql_parts.append(sql_query[start:match.start()])
+                start = match.end()
+        sql_parts.append(sql_query[start:])
+        parts = tuple(sql_parts)
+
+        # INSERT mints a new subject IRI on every call, so it never gets a template
+        template = None
+        if len(parts) > 1 and not _INSERT_PREFIX_RE.match(sql_query):
+            literals = [str(index + 1) for index in range(len(parts) - 1)]
+            try:
+                sparql = self._convert_uncached(self._fill_shape(parts, literals))
+            except Exception:
+                sparql = None
+            if sparql is not None:
+                template = self._build_shape_template(parts, literals, sparql)
+
+        return CompiledQuery(self, parts, template, self._schema_version())
+
+    def _schema_version(self) -> int:
+        """Version of the mapper's schema that conversions are built against"""
+        return self.schema_mapper.schema_version if self.schema_mapper else 0
+
+    def convert_many(self, sql_queries: Iterable[str]) -> List[str]:
+        """
+        Convert a batch of SQL query strings to SPARQL query strings
+
+        Queries are converted in order through the same cache as convert(), so
+        repeats within a batch (or from earlier calls) are converted only once.
+
+        Args:
+            sql_queries: SQL query strings
+
+        Returns:
+            SPARQL query strings, one per input query
+        """
+        convert = self.convert
+        return [convert(sql_query) for sql_query in sql_queries]
+
+    def invalidate_cache(self):
+        """
+        Drop all cached conversions and query shape templates
+
+        Schema changes made through the schema mapper are picked up without this,
+        since cache entries are keyed on the mapper's schema version.
+        """
+        self._convert_cached.cache_clear()
+        self._shape_counts.clear()
+        self._shape_templates.clear()
+
+    def _convert_versioned(self, sql_query: str, schema_version: int) -> str:
+        """
+        Convert a query missing from the text cache, specializing recurring shapes
+
+        Once more than _SHAPE_SPECIALIZE_AFTER queries differing only in integer
+        literals have been converted, the shape gets a SPARQL template and later
+        queries of that shape are answered by filling in their literals.
+        """
+        parts = tuple(_SHAPE_LITERAL_RE.split(sql_query))
+        if len(parts) == 1:
+            return self._convert_uncached(sql_query)
+
+        literals = _SHAPE_LITERAL_RE.findall(sql_query)
+        key = (parts, schema_version)
+        template = self._shape_templates.get(key)
+        if template is not None:
+            return template.format(*literals)
+
+        sparql = self._convert_uncached(sql_query)
+        if key in self._shape_templates:
+            return sparql
+
+        if len(self._shape_counts) >= _SHAPE_TABLE_LIMIT:
+            self._shape_counts.clear()
+        count = self._shape_counts.get(key, 0) + 1
+        self._shape_counts[key] = count
+        if count > _SHAPE_SPECIALIZE_AFTER:
+            del self._shape_counts[key]
+            if len(self._shape_templates) >= _SHAPE_TABLE_LIMIT:
+                self._shape_templates.clear()
+            self._shape_templates[key] = self._build_shape_template(parts, literals, sparql)
+        return sparql
+
+    def _build_shape_template(
+        self, parts: Tuple[str, ...], literals: List[str], sparql: str
+    ) -> Optional[str]:
+        """
+        Build a str.format template producing the SPARQL for any query of a shape
+
+        The shape is converted with two sets of probe literals; the template is
+        only kept if it reproduces both of those conversions and the one already
+        done for the real literals.
+
+        Args:
+            parts: Query text split around its integer literals
+            literals: Integer literals of the query that was just converted
+            sparql: SPARQL produced for that query
+
+        Returns:
+            Template string, or None if the shape cannot be specialized
+        """
+        probe_sets = [
+            [str(base + index) for index in range(len(literals))]
+            for base in _SHAPE_PROBE_BASES
+        ]
+        try:
+            probe_outputs = [
+                self._convert_uncached(self._fill_shape(parts, probes)) for probes in probe_sets
+            ]
+        except Exception:
+            return None
+
+        position = {probe: index for index, probe in enumerate(probe_sets[0])}
+        escaped = probe_outputs[0].replace('{', '{{').replace('}', '}}')
+        template = re.sub(
+            r'(?<!\d)(?:' + '|'.join(probe_sets[0]) + r')(?!\d)',
+            lambda match: '{' + str(position[match.group()]) + '}',
+            escaped,
+        )
+
+        if template.format(*probe_sets[1]) != probe_outputs[1]:
+            return None
+        if template.format(*literals) != sparql:
+            return None
+        return template
+
+    @staticmethod
+    def _fill_shape(parts: Tuple[str, ...], literals: List[str]) -> str:
+        """Rebuild query text from its shape parts and integer literals"""
+        pieces = [parts[0]]
+        for literal, part in zip(literals, parts[1:]):
+            pieces.append(literal)
+            pieces.append(part)
+        return ''.join(pieces)
+
+    def _convert_uncached(self, sql_query: str) -> str:
+        """Convert a stripped SQL query string without consulting the cache"""
+        # Check for UNION/INTERSECT/EXCEPT first, on the original text
+        if _UNION_RE.search(sql_query):
             return self._handle_union_query(sql_query)
 
+        # Keyword checks below all look at the same upper-cased text
+        query_upper = sql_query.upper()
+
         # Check for calculated columns, complex expressions, or special operators
-        select_part = sql_query.upper().split('FROM')[0] if 'FROM' in sql_query.upper() else sql_query.upper()
-        where_part = sql_query.upper().split('WHERE')[1] if 'WHERE' in sql_query.upper() else ""
+        select_part = query_upper.split('FROM')[0] if 'FROM' in query_upper else query_upper
+        where_part = query_upper.split('WHERE')[1] if 'WHERE' in query_upper else ""
 
         needs_enhanced = (
             any(op in select_part for op in ['*', '/', '+', '-']) or
@@ -182,14 +637,20 @@ class SQL2SPARQLConverter:
             ' OR ' in where_part
         )
 
-        if needs_enhanced and 'SELECT' in sql_query.upper():
+        if needs_enhanced and 'SELECT' in query_upper:
             return self._convert_with_expressions(sql_query)
 
         # Standard conversion path
         parsed_query = self.sql_parser.parse(sql_query)
+        self._reset_query_state()
         sparql_query = self._convert_query(parsed_query)
         return sparql_query.to_string()
 
+    def _reset_query_state(self):
+        """Forget subject variables allocated while converting the previous query"""
+        self.where_converter.subject_vars = {}
+        self.group_having_converter.subject_vars = {}
+
     def _convert_query(self, sql_query: SQLQuery) -> SPARQLQuery:
         """
         Convert parsed SQL query to SPARQL query
@@ -465,6 +926,7 @@ class SQL2SPARQLConverter:
 
         # Reset variable mappings
         self.var_mappings = {}
+        self.calc_alias_counter = 0
         select_vars = []
         triple_patterns: List[Triple] = []
 
@@ -529,7 +991,7 @@ class SQL2SPARQLConverter:
                 sparql_parts.append(f"ORDER BY {order_expr}")
 
         # Add LIMIT
-        limit_match = re.search(r'LIMIT\s+(\d+)', sql_query, re.IGNORECASE)
+        limit_match = _LIMIT_RE.search(sql_query)
         if limit_match:
             sparql_parts.append(f"LIMIT {limit_match.group(1)}")
 
@@ -538,8 +1000,8 @@ class SQL2SPARQLConverter:
     def _handle_union_query(self, sql_query: str) -> str:
         """Handle UNION/INTERSECT/EXCEPT queries"""
         # Check for ORDER BY and LIMIT at the end of the entire query
-        order_by_match = re.search(r'\s+ORDER\s+BY\s+(.*?)(?:\s+LIMIT|\s*$)', sql_query, re.IGNORECASE)
-        limit_match = re.search(r'\s+LIMIT\s+(\d+)', sql_query, re.IGNORECASE)
+        order_by_match = _UNION_ORDER_BY_RE.search(sql_query)
+        limit_match = _UNION_LIMIT_RE.search(sql_query)
 
         # Remove ORDER BY and LIMIT from the query before processing UNION parts
         clean_query = sql_query
@@ -549,7 +1011,7 @@ class SQL2SPARQLConverter:
             clean_query = clean_query[:limit_match.start()]
 
         # Split by UNION
-        parts = re.split(r'\s+UNION(?:\s+ALL)?\s+', clean_query, flags=re.IGNORECASE)
+        parts = _UNION_RE.split(clean_query)
 
         sparql_parts = []
         select_vars = None
@@ -564,13 +1026,13 @@ class SQL2SPARQLConverter:
             sub_sparql = self.convert(part)
 
             # Extract components
-            where_match = re.search(r'WHERE \{(.*?)\}', sub_sparql, re.DOTALL)
+            where_match = _SPARQL_WHERE_RE.search(sub_sparql)
             if where_match:
                 where_content = where_match.group(1)
 
                 if i == 0:
                     # First part - extract SELECT
-                    select_match = re.search(r'SELECT (.*)WHERE', sub_sparql, re.DOTALL)
+                    select_match = _SPARQL_SELECT_RE.search(sub_sparql)
                     if select_match:
                         select_vars = select_match.group(1).strip()
                         sparql_parts.append(f"SELECT {select_vars}")
@@ -598,8 +1060,11 @@ class SQL2SPARQLConverter:
 
     def _extract_clause(self, sql: str, start: str, end: str) -> str:
         """Extract SQL clause between keywords"""
-        pattern = fr'{start}\s+(.*?)(?:{end})'
-        match = re.search(pattern, sql, re.IGNORECASE | re.DOTALL)
+        pattern = _CLAUSE_RE_CACHE.get((start, end))
+        if pattern is None:
+            pattern = re.compile(fr'{start}\s+(.*?)(?:{end})', re.IGNORECASE | re.DOTALL)
+            _CLAUSE_RE_CACHE[(start, end)] = pattern
+        match = pattern.search(sql)
         if match:
             return match.group(1).strip()
         return ""
@@ -629,11 +1094,11 @@ class SQL2SPARQLConverter:
     def _is_calculated_expression(self, expr: str) -> bool:
         """Check if expression contains calculations"""
         # Remove alias part if present
-        expr_check = expr.upper().split(' AS ')[0] if ' AS ' in expr.upper() else expr
+        expr_check = expr.upper().split(' AS ')[0]
 
         # Check if it's an aggregate function (COUNT, SUM, etc.)
         agg_funcs = ['COUNT(', 'SUM(', 'AVG(', 'MIN(', 'MAX(']
-        if any(func in expr_check.upper() for func in agg_funcs):
+        if any(func in expr_check for func in agg_funcs):
             return False
 
         # Check for arithmetic operators
@@ -650,7 +1115,7 @@ class SQL2SPARQLConverter:
         # Check for alias
         alias = None
         if ' AS ' in expr.upper():
-            parts = re.split(r'\s+AS\s+', expr, flags=re.IGNORECASE)
+            parts = _AS_SPLIT_RE.split(expr)
             expr = parts[0].strip()
             alias = parts[1].strip()
 
@@ -683,11 +1148,12 @@ class SQL2SPARQLConverter:
         if alias:
             return f"({sparql_expr} AS ?{alias})"
         else:
-            return f"({sparql_expr} AS ?calc_{len(self.var_mappings)})"
+            self.calc_alias_counter += 1
+            return f"({sparql_expr} AS ?calc_{self.calc_alias_counter})"
 
     def _process_aggregate_function(self, expr: str, patterns: List) -> str:
         """Process aggregate function"""
-        match = re.match(r'(\w+)\((.*)\)', expr, re.IGNORECASE)
+        match = _AGG_CALL_RE.match(expr)
         if match:
             func = match.group(1).upper()
             col = match.group(2).strip()
@@ -711,7 +1177,7 @@ class SQL2SPARQLConverter:
                 var = self.var_mappings[col]
 
             # Check for alias
-            alias_match = re.search(r'\s+as\s+(\w+)', expr, re.IGNORECASE)
+            alias_match = _ALIAS_RE.search(expr)
             if alias_match:
                 alias = alias_match.group(1)
                 return f"({func}({var}) AS ?{alias})"
@@ -746,7 +1212,7 @@ class SQL2SPARQLConverter:
     def _create_triple_pattern(self, table: str, column: str, var: str) -> str:
         """Create triple pattern for table.column"""
         subject_var = f"?{table.lower()}"
-        predicate = f"<http://example.org/ontology/{column}>"
+        predicate = iri_ref(f"http://example.org/ontology/{column}")
         return f"{subject_var} {predicate} {var}"
 
     def _extract_columns_from_expr(self, expr: str) -> List[str]:
@@ -754,18 +1220,16 @@ class SQL2SPARQLConverter:
         columns = []
 
         # First, temporarily replace decimal numbers to avoid confusion
-        temp_expr = re.sub(r'\b\d+\.\d+\b', 'DECIMAL_PLACEHOLDER', expr)
+        temp_expr = _DECIMAL_LITERAL_RE.sub('DECIMAL_PLACEHOLDER', expr)
 
         # Look for table.column patterns (after decimal replacement)
-        pattern = r'\b(\w+\.\w+)\b'
-        matches = re.findall(pattern, temp_expr)
+        matches = _QUALIFIED_COLUMN_RE.findall(temp_expr)
         for match in matches:
             if 'DECIMAL_PLACEHOLDER' not in match:
                 columns.append(match)
 
         # Look for simple column names
-        pattern = r'\b(\w+)\b'
-        matches = re.findall(pattern, temp_expr)
+        matches = _WORD_RE.findall(temp_expr)
         for match in matches:
             if (match.upper() not in ['SELECT', 'FROM', 'WHERE', 'AS', 'AND', 'OR', 'DECIMAL_PLACEHOLDER'] and
                 not match.isdigit() and match not in columns):
@@ -775,124 +1239,254 @@ class SQL2SPARQLConverter:
         return columns
 
     def _process_complex_where(self, where_clause: str) -> List[str]:
-        """Process complex WHERE clause with AND/OR"""
-        filters = []
+        """
+        Process complex WHERE clause with AND/OR/NOT and parentheses
 
-        # Handle BETWEEN specially since it contains AND
-        if 'BETWEEN' in where_clause.upper():
-            # Extract BETWEEN conditions first
-            between_pattern = r'(\w+(?:\.\w+)?)\s+BETWEEN\s+(\S+)\s+AND\s+(\S+)'
-            between_matches = re.finditer(between_pattern, where_clause, re.IGNORECASE)
+        The clause is tokenized once, put in postfix order with the shunting-yard
+        algorithm (NOT > AND > OR) and rendered from the resulting tree. Each
+        top-level AND operand becomes its own FILTER.
+        """
+        tokens = self._tokenize_where(where_clause)
+        condition = self._build_condition_tree(self._where_to_postfix(tokens))
+
+        conjuncts = []
+        pending = [condition] if condition else []
+        while pending:
+            node = pending.pop()
+            if node[0] == 'AND':
+                pending.extend((node[2], node[1]))
+            else:
+                conjuncts.append(node)
 
-            for match in between_matches:
-                col = match.group(1)
-                lower = match.group(2)
-                upper = match.group(3)
+        return [f"FILTER({self._render_condition(node)[0]})" for node in conjuncts]
 
-                # Get variable for column
-                var = self.var_mappings.get(col, f"?{col.replace('.', '_').lower()}")
+    def _tokenize_where(self, where_clause: str) -> List[Tuple[str, str]]:
+        """
+        Split a WHERE clause into predicates, AND/OR/NOT and grouping parentheses
 
-                # Create filter
-                filters.append(f"FILTER({var} >= {lower} && {var} <= {upper})")
+        The AND of a BETWEEN and parentheses that belong to a predicate, such as
+        IN (...) lists or (price * stock) > 1000, stay inside the predicate text.
+        """
+        lexemes = list(_WHERE_LEXEME_RE.finditer(where_clause))
+        tokens: List[Tuple[str, str]] = []
+        start = end = -1
+        between_pending = False
+        i = 0
+
+        while i < len(lexemes):
+            text = lexemes[i].group()
+            word = text.upper()
+
+            if start < 0:
+                if word == 'NOT':
+                    tokens.append(('NOT', word))
+                    i += 1
+                    continue
+                if text == '(':
+                    close = self._matching_paren(lexemes, i)
+                    # A group followed by a comparison, e.g. (price * stock) > 1000,
+                    # is part of a predicate rather than a boolean grouping
+                    follower = ')'
+                    if close + 1 < len(lexemes):
+                        follower = lexemes[close + 1].group().upper()
+                    if follower in ('AND', 'OR', ')'):
+                        tokens.append(('(', text))
+                        i += 1
+                        continue
+
+            if (word == 'OR' or (word == 'AND' and not between_pending)) or text == ')':
+                if start >= 0:
+                    tokens.append(('PRED', where_clause[start:end]))
+                    start = -1
+                tokens.append((word, word))
+                i += 1
+                continue
 
-                # Remove this BETWEEN from where_clause for further processing
-                where_clause = where_clause[:match.start()] + where_clause[match.end():]
+            # Predicate text
+            if start < 0:
+                start = lexemes[i].start()
+            if word == 'BETWEEN':
+                between_pending = True
+            elif word == 'AND':
+                between_pending = False
+            if text == '(':
+                i = self._matching_paren(lexemes, i)
+            end = lexemes[i].end()
+            i += 1
+
+        if start >= 0:
+            tokens.append(('PRED', where_clause[start:end]))
+        return tokens
+
+    @staticmethod
+    def _matching_paren(lexemes: List, open_index: int) -> int:
+        """Index of the lexeme closing the parenthesis at open_index (or the last one)"""
+        depth = 0
+        for index in range(open_index, len(lexemes)):
+            text = lexemes[index].group()
+            if text == '(':
+                depth += 1
+            elif text == ')':
+                depth -= 1
+                if depth == 0:
+                    return index
+        return len(lexemes) - 1
+
+    @staticmethod
+    def _where_to_postfix(tokens: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Reorder WHERE tokens into postfix (RPN) with the shunting-yard algorithm"""
+        output: List[Tuple[str, str]] = []
+        operators: List[Tuple[str, str]] = []
+
+        for token in tokens:
+            kind = token[0]
+            if kind == 'PRED':
+                output.append(token)
+            elif kind in ('NOT', '('):
+                operators.append(token)
+            elif kind == ')':
+                while operators and operators[-1][0] != '(':
+                    output.append(operators.pop())
+                if operators:
+                    operators.pop()
+            else:
+                precedence = _BOOLEAN_PRECEDENCE[kind]
+                while (operators and operators[-1][0] != '(' and
+                       _BOOLEAN_PRECEDENCE[operators[-1][0]] >= precedence):
+                    output.append(operators.pop())
+                operators.append(token)
+
+        while operators:
+            token = operators.pop()
+            if token[0] != '(':
+                output.append(token)
+        return output
+
+    @staticmethod
+    def _build_condition_tree(postfix: List[Tuple[str, str]]) -> Optional[Tuple]:
+        """Build a ('PRED', text) / ('NOT', node) / ('AND'|'OR', left, right) tree"""
+        stack: List[Tuple] = []
+        for kind, text in postfix:
+            if kind == 'PRED':
+                stack.append(('PRED', text))
+            elif len(stack) < (1 if kind == 'NOT' else 2):
+                raise ValueError(f"{kind} is missing an operand in WHERE clause")
+            elif kind == 'NOT':
+                stack.append(('NOT', stack.pop()))
+            else:
+                right = stack.pop()
+                stack.append((kind, stack.pop(), right))
+        return stack[-1] if stack else None
 
-        # Now process remaining conditions
-        if where_clause.strip():
-            # Split by AND, preserving OR groups
-            and_parts = re.split(r'\s+AND\s+', where_clause, flags=re.IGNORECASE)
+    def _render_condition(self, node: Tuple) -> Tuple[str, int]:
+        """Render a condition tree as a SPARQL expression and its precedence"""
+        kind = node[0]
+        if kind == 'PRED':
+            return self._render_predicate(node[1].strip())
 
-            for part in and_parts:
-                part = part.strip()
-                if not part:
-                    continue
+        if kind == 'NOT':
+            operand = self._render_condition(node[1])
+            return f"!({operand[0]})", _BOOLEAN_PRECEDENCE['NOT']
 
-                # Check for OR conditions
-                or_parts = re.split(r'\s+OR\s+', part, flags=re.IGNORECASE)
-
-                if len(or_parts) > 1:
-                    # Create OR filter
-                    or_filters = []
-                    for or_part in or_parts:
-                        filter_expr = self._create_filter_expression(or_part.strip())
-                        if filter_expr:
-                            or_filters.append(filter_expr)
-                    if or_filters:
-                        filters.append(f"FILTER({' || '.join(or_filters)})")
-                else:
-                    # Single condition
-                    filter_expr = self._create_filter_expression(part.strip())
-                    if filter_expr:
-                        filters.append(f"FILTER({filter_expr})")
-
-        return filters
-
-    def _create_filter_expression(self, condition: str) -> str:
-        """Create SPARQL filter expression from SQL condition"""
-        # First check if there's a calculated expression in the condition
-        if any(op in condition for op in ['*', '/', '+', '-']):
-            # Handle calculated expressions like (price * stock) > 1000
-            match = re.match(r'\((.*?)\)\s*([><=]+)\s*(\d+)', condition)
+        left = self._render_condition(node[1])
+        right = self._render_condition(node[2])
+
+        precedence = _BOOLEAN_PRECEDENCE[kind]
+        parts = []
+        for expr, child_precedence in (left, right):
+            # && under || is parenthesized for readability even though it binds tighter
+            and_under_or = kind == 'OR' and child_precedence == _BOOLEAN_PRECEDENCE['AND']
+            if child_precedence < precedence or and_under_or:
+                expr = f"({expr})"
+            parts.append(expr)
+        operator = '&&' if kind == 'AND' else '||'
+        return f"{parts[0]} {operator} {parts[1]}", precedence
+
+    def _render_predicate(self, predicate: str) -> Tuple[str, int]:
+        """
+        Render a single WHERE predicate as a SPARQL expression and its precedence
+
+        Raises:
+            ValueError: If the predicate is not a form the converter understands;
+                dropping it would silently change what an OR or NOT matches
+        """
+        match = _PREDICATE_RE.match(predicate)
+        if not match:
+            raise ValueError(f"Unsupported WHERE condition: {predicate}")
+        kind = match.lastgroup
+
+        if kind == 'between':
+            var = self._column_var(match.group('b_col'))
+            lower, upper = match.group('b_lower'), match.group('b_upper')
+            return f"{var} >= {lower} && {var} <= {upper}", _BOOLEAN_PRECEDENCE['AND']
+        if kind == 'not_between':
+            var = self._column_var(match.group('nb_col'))
+            lower, upper = match.group('nb_lower'), match.group('nb_upper')
+            return f"{var} < {lower} || {var} > {upper}", _BOOLEAN_PRECEDENCE['OR']
+
+        if kind == 'expression':
+            # Calculated expressions like (price * stock) > 1000
+            expr_tree = self.expression_builder.parse_expression(match.group('e_expr').strip())
+            sparql_expr = self.expression_builder.to_sparql_expression(expr_tree, self.var_mappings)
+            expr = f"{sparql_expr} {match.group('e_op')} {match.group('e_value')}"
+        else:
+            operator = match.group('c_op').upper().split()
+            expr = self._create_comparison_expression(
+                match.group('c_col'), operator[-1], match.group('c_value').strip()
+            )
+            if expr and operator[0] == 'NOT':
+                # NOT IN / NOT LIKE negate the positive form
+                return f"!({expr})", _BOOLEAN_PRECEDENCE['NOT']
+        if not expr:
+            raise ValueError(f"Unsupported WHERE condition: {predicate}")
+        return expr, len(_BOOLEAN_PRECEDENCE) + 1
+
+    def _column_var(self, column: str) -> str:
+        """Get the SPARQL variable bound to a (possibly qualified) column"""
+        return self.var_mappings.get(column, f"?{column.replace('.', '_').lower()}")
+
+    def _create_comparison_expression(self, column: str, operator: str, value: str) -> str:
+        """Create SPARQL filter expression for a column operator value comparison"""
+        var = self._column_var(column)
+
+        # Handle different operators
+        if operator == 'LIKE':
+            return WhereConverter.build_like_filter(var, value.strip("'\""))
+        elif operator == 'IN':
+            return f"{var} IN ({self._render_in_values(value.strip('()'))})"
+        elif operator == 'BETWEEN':
+            match = _BETWEEN_RANGE_RE.match(value)
             if match:
-                expr = match.group(1).strip()
-                operator = match.group(2)
-                value = match.group(3)
-
-                # Parse the expression and convert to SPARQL
-                expr_tree = self.expression_builder.parse_expression(expr) if hasattr(self, 'expression_builder') else None
-                if expr_tree and hasattr(self, 'expression_builder'):
-                    sparql_expr = self.expression_builder.to_sparql_expression(expr_tree, self.var_mappings)
-                    return f"{sparql_expr} {operator} {value}"
-
-        # Standard pattern matching for column operator value
-        match = re.match(r'(\w+(?:\.\w+)?)\s*(=|!=|<>|<|>|<=|>=|LIKE|IN|BETWEEN)\s+(.+)',
-                        condition, re.IGNORECASE)
-        if match:
-            column = match.group(1)
-            operator = match.group(2).upper()
-            value = match.group(3).strip()
-
-            # Get variable for column
-            var = self.var_mappings.get(column, f"?{column.replace('.', '_').lower()}")
-
-            # Handle different operators
-            if operator == 'LIKE':
-                pattern = value.strip("'\"")
-                pattern = pattern.replace('%', '.*').replace('_', '.')
-                return f'regex({var}, "{pattern}", "i")'
-            elif operator == 'IN':
-                values = value.strip('()').split(',')
-                value_list = []
-                for v in values:
-                    v = v.strip().strip("'\"")
-                    try:
-                        float(v)
-                        value_list.append(v)
-                    except ValueError:
-                        value_list.append(f'"{v}"')
-                return f"{var} IN ({', '.join(value_list)})"
-            elif operator == 'BETWEEN':
-                match = re.match(r'(\S+)\s+AND\s+(\S+)', value, re.IGNORECASE)
-                if match:
-                    lower = match.group(1)
-                    upper = match.group(2)
-                    return f"({var} >= {lower} && {var} <= {upper})"
-            else:
-                # Standard comparison
-                value = value.strip("'\"")
-                try:
-                    float(value)
-                    value_formatted = value
-                except ValueError:
-                    value_formatted = f'"{value}"'
-
-                op_map = {'=': '=', '!=': '!=', '<>': '!='}
-                sparql_op = op_map.get(operator, operator.lower())
-                return f"{var} {sparql_op} {value_formatted}"
+                lower, upper = match.groups()
+                return f"({var} >= {lower} && {var} <= {upper})"
+        else:
+            # Standard comparison
+            sparql_op = _SPARQL_COMPARISON_OPS.get(operator, operator.lower())
+            return f"{var} {sparql_op} {self._sparql_literal(value)}"
 
         return ""
 
+    @staticmethod
+    def _render_in_values(values: str) -> str:
+        """Render the items of a SQL IN list as SPARQL terms in one regex sweep"""
+        items = []
+        for match in _IN_VALUE_RE.finditer(values):
+            kind = match.lastgroup
+            assert kind is not None
+            text = match.group(kind)
+            items.append(text if kind == 'number' else sparql_string(text))
+        return ', '.join(items)
+
+    @staticmethod
+    def _sparql_literal(value: str) -> str:
+        """Format a SQL value as a SPARQL numeric or string literal"""
+        value = value.strip().strip("'\"")
+        try:
+            float(value)
+            return value
+        except ValueError:
+            return sparql_string(value)
+
     def _process_group_by(self, group_clause: str) -> List[str]:
         """Process GROUP BY clause"""
         vars = []
@@ -905,7 +1499,7 @@ class SQL2SPARQLConverter:
     def _process_having(self, having_clause: str) -> str:
         """Process HAVING clause"""
         # Simple conversion for COUNT() > value patterns
-        match = re.match(r'COUNT\((.*)\)\s*([><=]+)\s*(\d+)', having_clause, re.IGNORECASE)
+        match = _HAVING_COUNT_RE.match(having_clause)
         if match:
             col = match.group(1).strip()
             op = match.group(2)
@@ -1,10 +1,15 @@
 """
 Core data models for SQL2SPARQL conversion
 """
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Tuple
 from enum import Enum
 
+# dataclass(slots=True) is only available on Python 3.10+; older interpreters
+# fall back to regular __dict__-backed instances.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class QueryType(Enum):
     """SQL query types supported"""
@@ -30,7 +35,7 @@ class CombinationType(Enum):
     EXCEPT = "EXCEPT"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Triple:
     """RDF Triple representation"""
     subject: str
@@ -42,7 +47,7 @@ class Triple:
         return f"{self.subject} {self.predicate} {self.object}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Attribute:
     """SQL attribute representation"""
     relation: str
@@ -55,7 +60,7 @@ class Attribute:
         return self.aggregate is not None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JoinCondition:
     """SQL join condition"""
     left_operand: Attribute
@@ -63,7 +68,7 @@ class JoinCondition:
     operator: str = "="
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WhereCondition:
     """SQL WHERE condition"""
     attribute: Attribute
@@ -72,7 +77,7 @@ class WhereCondition:
     is_join: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SQLQuery:
     """Parsed SQL query representation"""
     type: QueryType
@@ -99,7 +104,7 @@ class SQLQuery:
     right_query: Optional['SQLQuery'] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SPARQLQuery:
     """SPARQL query representation"""
     select_vars: List[str] = field(default_factory=list)
@@ -128,75 +133,60 @@ class SPARQLQuery:
 
     def _build_select_query(self) -> str:
         """Build SELECT query string"""
-        query_parts = []
-
-        # SELECT clause
-        select_clause = "SELECT " + " ".join(self.select_vars)
-        query_parts.append(select_clause)
+        # Every line of the query goes into one list that is joined once
+        lines = [f"SELECT {' '.join(self.select_vars)}"]
 
         # WHERE clause
-        where_clause = "WHERE {\n"
-        for pattern in self.where_patterns:
-            where_clause += f"  {pattern.to_sparql_pattern()} .\n"
-
-        # FILTER conditions
-        for filter_cond in self.filter_conditions:
-            where_clause += f"  FILTER({filter_cond})\n"
-
-        where_clause += "}"
-        query_parts.append(where_clause)
+        lines.append("WHERE {")
+        self._append_where_body(lines)
+        lines.append("}")
 
         # GROUP BY
         if self.group_by_vars:
-            query_parts.append("GROUP BY " + " ".join(self.group_by_vars))
+            lines.append(f"GROUP BY {' '.join(self.group_by_vars)}")
 
         # HAVING
         if self.having_conditions:
-            having = "HAVING(" + " && ".join(self.having_conditions) + ")"
-            query_parts.append(having)
+            lines.append(f"HAVING({' && '.join(self.having_conditions)})")
 
         # ORDER BY
         if self.order_by_vars:
-            order_parts = []
-            for var, direction in self.order_by_vars:
-                order_parts.append(f"{direction}({var})")
-            query_parts.append("ORDER BY " + " ".join(order_parts))
+            order_parts = [f"{direction}({var})" for var, direction in self.order_by_vars]
+            lines.append(f"ORDER BY {' '.join(order_parts)}")
 
         # LIMIT/OFFSET
         if self.limit:
-            query_parts.append(f"LIMIT {self.limit}")
+            lines.append(f"LIMIT {self.limit}")
         if self.offset:
-            query_parts.append(f"OFFSET {self.offset}")
+            lines.append(f"OFFSET {self.offset}")
 
-        return "\n".join(query_parts)
+        return "\n".join(lines)
 
     def _build_insert_query(self) -> str:
         """Build INSERT DATA query string"""
-        query = "INSERT DATA {\n"
-        for triple in self.insert_triples:
-            query += f"  {triple.to_sparql_pattern()} .\n"
-        query += "}"
-        return query
+        lines = ["INSERT DATA {"]
+        lines.extend(f"  {triple.to_sparql_pattern()} ." for triple in self.insert_triples)
+        lines.append("}")
+        return "\n".join(lines)
 
     def _build_delete_query(self) -> str:
         """Build DELETE WHERE query string"""
-        query = "DELETE {\n"
-        for pattern in self.delete_patterns:
-            query += f"  {pattern.to_sparql_pattern()} .\n"
-        query += "}\n"
-
-        query += "WHERE {\n"
-        for pattern in self.where_patterns:
-            query += f"  {pattern.to_sparql_pattern()} .\n"
+        lines = ["DELETE {"]
+        lines.extend(f"  {pattern.to_sparql_pattern()} ." for pattern in self.delete_patterns)
+        lines.append("}")
 
-        for filter_cond in self.filter_conditions:
-            query += f"  FILTER({filter_cond})\n"
+        lines.append("WHERE {")
+        self._append_where_body(lines)
+        lines.append("}")
+        return "\n".join(lines)
 
-        query += "}"
-        return query
+    def _append_where_body(self, lines: List[str]):
+        """Append the triple patterns and FILTER lines of the WHERE block"""
+        lines.extend(f"  {pattern.to_sparql_pattern()} ." for pattern in self.where_patterns)
+        lines.extend(f"  FILTER({filter_cond})" for filter_cond in self.filter_conditions)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RelationalSchema:
     """Extracted relational schema from RDF data"""
     tables: Dict[str, List[str]] = field(default_factory=dict)
@@ -20,10 +20,38 @@ class SchemaMapper:
         Args:
             rdf_graph: RDFLib Graph object containing RDF data
         """
-        self.graph = rdf_graph or Graph()
+        self.graph = rdf_graph if rdf_graph is not None else Graph()
         self.schema = RelationalSchema()
         self.namespace_map: Dict[str, str] = {}
         self._extracted = False
+        # Bumped whenever the data or schema changes, so callers can drop cached results;
+        # the graph size seen at the last bump reveals direct edits to the graph
+        self._schema_version = 0
+        self._graph_size = len(self.graph)
+        # Column -> predicate URI and table -> class URI, built from the graph on first
+        # lookup and rebuilt once schema_version moves on
+        self._column_properties: Dict[str, str] = {}
+        self._table_classes: Dict[str, str] = {}
+        self._lookup_version: Optional[int] = None
+
+    @property
+    def schema_version(self) -> int:
+        """
+        Version of the data and schema, for keying cached results
+
+        Loading data or a schema through the mapper bumps it. Triples added to
+        or removed from self.graph directly bump it on the next read, since the
+        graph size changes; edits that keep the size need invalidate_cache().
+        """
+        if len(self.graph) != self._graph_size:
+            self._extracted = False
+            self._bump_schema_version()
+        return self._schema_version
+
+    def _bump_schema_version(self):
+        """Start a new schema version for the graph as it is now"""
+        self._graph_size = len(self.graph)
+        self._schema_version += 1
 
     def load_rdf_file(self, file_path: str, format: str = "turtle"):
         """
@@ -35,6 +63,7 @@ class SchemaMapper:
         """
         self.graph.parse(file_path, format=format)
         self._extracted = False
+        self._bump_schema_version()
 
     def load_rdf_string(self, data: str, format: str = "turtle"):
         """
@@ -46,6 +75,7 @@ class SchemaMapper:
         """
         self.graph.parse(data=data, format=format)
         self._extracted = False
+        self._bump_schema_version()
 
     def extract_schema(self) -> RelationalSchema:
         """
@@ -64,8 +94,20 @@ class SchemaMapper:
             self.schema.add_table(table_name, list(predicates))
 
         self._extracted = True
+        self._bump_schema_version()
         return self.schema
 
+    def load_schema(self, schema: RelationalSchema):
+        """
+        Use a previously extracted schema instead of extracting it again
+
+        Args:
+            schema: RelationalSchema extracted from the same RDF data
+        """
+        self.schema = schema
+        self._extracted = True
+        self._bump_schema_version()
+
     def _extract_type_predicates(self) -> Dict[str, Set[str]]:
         """
         Extract unique predicates for each RDF type
@@ -175,6 +217,73 @@ class SchemaMapper:
         else:
             return f"<http://example.org/{attribute}>", f"?{attribute}_value"
 
+    def get_column_property(self, column: str) -> str:
+        """
+        Get the RDF predicate URI for a column name
+
+        When several predicates share the column's local name, the URI that
+        sorts first is used, so the choice does not depend on graph order.
+
+        Args:
+            column: Attribute name
+
+        Returns:
+            URI of the predicate with that local name, or a default ontology URI
+        """
+        self._build_lookups()
+        return self._column_properties.get(
+            column.lower(), f"http://example.org/ontology/{column}"
+        )
+
+    def get_table_class(self, table: str) -> str:
+        """
+        Get the RDF class URI for a table name
+
+        When several classes share the table's local name, the URI that sorts
+        first is used, so the choice does not depend on graph order.
+
+        Args:
+            table: Table name
+
+        Returns:
+            URI of the class with that local name, or a default type URI
+        """
+        self._build_lookups()
+        return self._table_classes.get(table.lower(), f"http://example.org/types/{table.title()}")
+
+    def invalidate_cache(self):
+        """
+        Mark the data as changed after self.graph was modified directly
+
+        Loading data through the mapper does this already, and so does any
+        direct edit that changes the number of triples. Edits that keep it
+        (replacing a triple) need this call. Either way the lookups and the
+        results converters cached against the old schema version are dropped.
+        """
+        self._bump_schema_version()
+
+    def _build_lookups(self):
+        """Index predicate and class URIs by local name in a single pass over the graph"""
+        version = self.schema_version
+        if self._lookup_version == version:
+            return
+
+        column_properties: Dict[str, str] = {}
+        table_classes: Dict[str, str] = {}
+        for subj, pred, obj in self.graph:
+            if pred == RDF.type:
+                name, uri, index = self._get_table_name(str(obj)), str(obj), table_classes
+            else:
+                name, uri, index = self._get_attribute_name(pred), str(pred), column_properties
+            # Colliding local names keep the URI that sorts first
+            current = index.get(name)
+            if current is None or uri < current:
+                index[name] = uri
+
+        self._column_properties = column_properties
+        self._table_classes = table_classes
+        self._lookup_version = version
+
     def get_schema_info(self) -> Dict[str, List[str]]:
         """
         Get schema information as a dictionary
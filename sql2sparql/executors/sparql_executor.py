@@ -2,12 +2,21 @@
 SPARQL Executor - Executes SPARQL queries on RDF stores
 Supports multiple backends including AllegroGraph, Fuseki, and in-memory RDFLib
 """
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from enum import Enum
+import functools
 import json
 import requests
 from SPARQLWrapper import SPARQLWrapper, JSON, POST, GET, BASIC
-from rdflib import Graph
+from rdflib import Graph, URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_query(query: str, namespaces: Tuple[Tuple[str, URIRef], ...]) -> Query:
+    """Parse and translate a SPARQL query to RDFLib algebra once per query text"""
+    return prepareQuery(query, initNs=dict(namespaces))
 
 
 class StoreType(Enum):
@@ -182,7 +191,10 @@ class SPARQLExecutor:
             List of result rows
         """
         results = []
-        qres = self.graph.query(query)
+        # Filters and calculated columns are evaluated from the prepared algebra,
+        # so repeated queries skip parsing and translation
+        prepared = _prepare_query(query, tuple(self.graph.namespaces()))
+        qres = self.graph.query(prepared)
 
         # Get variable names
         var_names = [str(var) for var in qres.vars] if qres.vars else []
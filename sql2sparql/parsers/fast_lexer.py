@@ -0,0 +1,154 @@
+"""
+Fast SQL Lexer - Single-pass tokenizer producing the same tokens as sqlparse's lexer
+"""
+import re
+from typing import Any, List, Optional
+
+from sqlparse import keywords, lexer
+from sqlparse import tokens as T
+from sqlparse.sql import Token
+
+# Flags sqlparse compiles each of its lexer rules with
+_RULE_FLAGS = re.IGNORECASE | re.UNICODE
+# Numbered backreferences would point at the wrong group once rules are combined
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def _default_lexer_rules() -> Optional[List[Any]]:
+    """
+    Return the default lexer's compiled rules if they are keywords.SQL_REGEX
+
+    The fast path re-implements sqlparse's lexer loop on top of its private rule
+    table, so it is only used when that table has the layout it was written for:
+    (pattern, action) pairs that the default lexer compiles one-to-one, in order
+    and with the same flags. Any other layout makes tokenize() fall back to
+    sqlparse's own lexer.
+    """
+    rules = keywords.SQL_REGEX
+    compiled = getattr(lexer.Lexer.get_default_instance(), '_SQL_REGEX', None)
+    if not isinstance(compiled, list) or len(compiled) != len(rules):
+        return None
+
+    for rule, compiled_rule in zip(rules, compiled):
+        if not (isinstance(rule, tuple) and len(rule) == 2 and isinstance(rule[0], str)):
+            return None
+        pattern, action = rule
+        if action is not keywords.PROCESS_AS_KEYWORD and not (
+            isinstance(action, tuple) and action in T.Token
+        ):
+            return None
+        if _BACKREFERENCE_RE.search(pattern):
+            return None
+
+        match, ttype = compiled_rule
+        regex = getattr(match, '__self__', None)
+        if not (
+            isinstance(regex, re.Pattern) and regex.pattern == pattern and ttype is action
+            and regex.flags & _RULE_FLAGS == _RULE_FLAGS
+        ):
+            return None
+    return compiled
+
+
+def _build_token_re() -> "Optional[re.Pattern[str]]":
+    """
+    Combine sqlparse's ordered lexer rules into one alternation
+
+    Each rule is wrapped in a named group r<index>. Alternatives are tried left to
+    right, so the first rule that matches at a position wins, exactly as in
+    sqlparse's per-rule loop, but with one regex call per token instead of one
+    per rule.
+    """
+    alternatives = [
+        f'(?P<r{index}>{pattern})' for index, (pattern, _) in enumerate(keywords.SQL_REGEX)
+    ]
+    try:
+        return re.compile('|'.join(alternatives), _RULE_FLAGS)
+    except re.error:
+        return None
+
+
+_LEXER_RULES = _default_lexer_rules()
+_TOKEN_RE = _build_token_re() if _LEXER_RULES is not None else None
+_RULE_ACTIONS = {
+    f'r{index}': action for index, (_, action) in enumerate(keywords.SQL_REGEX)
+} if _TOKEN_RE is not None else {}
+
+# Characters that always lex as the same one-character token, whatever follows
+# them. The parser never mutates tokens, so one instance of each is shared.
+_SHARED_TOKENS = {
+    ' ': Token(T.Whitespace, ' '),
+    '\n': Token(T.Newline, '\n'),
+    ',': Token(T.Punctuation, ','),
+    '(': Token(T.Punctuation, '('),
+    ')': Token(T.Punctuation, ')'),
+    ';': Token(T.Punctuation, ';'),
+}
+
+
+def tokenize(sql: str) -> List[Token]:
+    """
+    Split SQL text into flat sqlparse tokens
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        Tokens of the first statement, up to and including its ';'
+    """
+    default_lexer = lexer.Lexer.get_default_instance()
+    # Dollar-quoted literals and /* */ comments need sqlparse's span matching, and
+    # a default lexer given other rules (set_SQL_REGEX) must be used as it is
+    if (
+        _TOKEN_RE is None or '$' in sql or '/*' in sql
+        or getattr(default_lexer, '_SQL_REGEX', None) is not _LEXER_RULES
+    ):
+        return _tokenize_with_sqlparse(sql)
+
+    match_at = _TOKEN_RE.match
+    shared_tokens = _SHARED_TOKENS
+    tokens: List[Token] = []
+    pos = 0
+    length = len(sql)
+
+    while pos < length:
+        shared = shared_tokens.get(sql[pos])
+        if shared is not None:
+            tokens.append(shared)
+            pos += 1
+            if shared.value == ';':
+                break
+            continue
+
+        match = match_at(sql, pos)
+        if match is None:
+            value = sql[pos]
+            tokens.append(Token(T.Error, value))
+            pos += 1
+            continue
+
+        value = match.group()
+        rule = match.lastgroup
+        assert rule is not None
+        action = _RULE_ACTIONS[rule]
+        if action is keywords.PROCESS_AS_KEYWORD:
+            ttype, value = default_lexer.is_keyword(value)
+        else:
+            ttype = action
+        tokens.append(Token(ttype, value))
+        pos = match.end()
+
+        if value == ';':
+            break
+
+    return tokens
+
+
+def _tokenize_with_sqlparse(sql: str) -> List[Token]:
+    """Tokenize with sqlparse's own lexer (stops after the first ';')"""
+    tokens: List[Token] = []
+    for ttype, value in lexer.tokenize(sql):
+        tokens.append(Token(ttype, value))
+        if value == ';':
+            break
+    return tokens
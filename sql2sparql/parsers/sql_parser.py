@@ -1,32 +1,83 @@
 """
 SQL Parser - Parses SQL queries and extracts components for conversion
 """
+import functools
 import re
-import sqlparse
-from typing import List
-from sqlparse.sql import TokenList
+import sys
+from types import MappingProxyType
+from typing import ClassVar, List, Mapping, Optional, Tuple
+from sqlparse.sql import Token
 from sqlparse.tokens import DML
 
+from .fast_lexer import tokenize
 from ..core.models import (
     SQLQuery, QueryType, Attribute, JoinCondition,
     WhereCondition, AggregateFunction, CombinationType
 )
 
+# Table/column names repeat across queries; interning lets every parsed
+# query share one string object per identifier
+_intern = sys.intern
+
+# Patterns are compiled once at import time so the hot parsing paths call the
+# compiled objects directly instead of going through the re module's cache
+_AS_RE = re.compile(r'\s+AS\s+', re.IGNORECASE)
+# One alternation covers every aggregate, so a SELECT item costs a
+# single match attempt instead of one regex per function name
+_AGG_RE = re.compile(r'(?P<fn>COUNT|SUM|AVG|MIN|MAX)\s*\(\s*(?P<arg>[^)]+?)\s*\)', re.IGNORECASE)
+# A whole "AGG(col) [AS alias]" item, so the common aggregate case needs one match
+_AGG_ITEM_RE = re.compile(
+    r'\s*(?P<fn>COUNT|SUM|AVG|MIN|MAX)\s*\(\s*(?P<arg>[^)]+?)\s*\)'
+    r'(?:\s+AS\s+(?P<alias>\w+))?\s*',
+    re.IGNORECASE
+)
+# One WHERE condition, tried in order as a join (t1.a = t2.b), an expression
+# comparison ((price * stock) > 1000) or a plain comparison (incl. LIKE, IN, BETWEEN)
+_CONDITION_RE = re.compile(
+    r'(?P<lt>\w+)\.(?P<la>\w+)\s*=\s*(?P<rt>\w+)\.(?P<ra>\w+)'
+    r'|(?P<expr>\([^)]+\))\s*(?P<expr_op>[=<>!]+)\s*(?P<expr_val>.+)'
+    r'|(?P<attr>[\w.]+)\s*(?P<op>[=<>!]+|LIKE|IN|BETWEEN|NOT\s+IN|NOT\s+BETWEEN)\s*(?P<val>.+)',
+    re.IGNORECASE
+)
+_HAVING_RE = re.compile(r'(\w+)\s*\(\s*([\w.]+)\s*\)\s*([=<>!]+)\s*(.+)')
+# Leading INSERT/DELETE keyword; a whole word, so "Inserting ..." is not an INSERT
+_DML_PREFIX_RE = re.compile(r'(INSERT|DELETE)\b', re.IGNORECASE)
+# INSERT/DELETE markers, matched case-insensitively on the original text. Offsets
+# found in an upper-cased copy would not carry over, since upper() can change the
+# length of non-ASCII text ('ß' becomes 'SS').
+_INSERT_INTO_RE = re.compile(r'INSERT\s+INTO(?=\s)', re.IGNORECASE)
+_VALUES_RE = re.compile(r'VALUES', re.IGNORECASE)
+_DELETE_FROM_RE = re.compile(r'DELETE\s+FROM(?=\s)', re.IGNORECASE)
+_WHERE_PREFIX_RE = re.compile(r'WHERE\s', re.IGNORECASE)
+
+# Tokens the top-level SELECT loop steps over between clauses
+_SKIP_TOKENS = frozenset([',', ';', '(', ')'])
+
+# Upper-cased tokens that end each clause ("ORDER" followed by "BY" is checked separately)
+_COMBINATION_KEYWORDS = frozenset(['UNION', 'INTERSECT', 'EXCEPT'])
+_END_FROM = frozenset(['WHERE', 'GROUP', 'GROUP BY', 'HAVING', 'ORDER BY', 'LIMIT', ';'])
+_END_WHERE = (
+    frozenset(['GROUP', 'GROUP BY', 'HAVING', 'ORDER BY', 'LIMIT', ';']) | _COMBINATION_KEYWORDS
+)
+_END_GROUP_BY = frozenset(['HAVING', 'ORDER', 'ORDER BY', 'LIMIT', ';'])
+_END_HAVING = frozenset(['ORDER', 'LIMIT', ';'])
+_END_ORDER_BY = frozenset(['LIMIT', 'OFFSET', ';'])
+_ORDER_DIRECTIONS = frozenset(['ASC', 'DESC'])
+
 
 class SQLParser:
     """
     Parses SQL queries and extracts components needed for SPARQL conversion
     """
 
-    def __init__(self):
-        """Initialize SQL parser"""
-        self.aggregate_map = {
-            'COUNT': AggregateFunction.COUNT,
-            'SUM': AggregateFunction.SUM,
-            'AVG': AggregateFunction.AVG,
-            'MIN': AggregateFunction.MIN,
-            'MAX': AggregateFunction.MAX
-        }
+    # Shared by all parsers; read-only so no instance can alter it for the others
+    aggregate_map: ClassVar[Mapping[str, AggregateFunction]] = MappingProxyType({
+        'COUNT': AggregateFunction.COUNT,
+        'SUM': AggregateFunction.SUM,
+        'AVG': AggregateFunction.AVG,
+        'MIN': AggregateFunction.MIN,
+        'MAX': AggregateFunction.MAX
+    })
 
     def parse(self, sql_query: str) -> SQLQuery:
         """
@@ -40,35 +91,65 @@ class SQLParser:
         """
         # Clean and format the query
         sql_query = sql_query.strip()
-        if not sql_query.endswith(';'):
+        if not sql_query:
+            raise ValueError("Empty SQL query")
+        if sql_query[-1] != ';':
             sql_query += ';'
 
-        # Parse using sqlparse
-        parsed = sqlparse.parse(sql_query)[0]
+        # The shared cache holds base-class parses; subclasses may parse differently
+        if type(self) is not SQLParser:
+            return self._parse_normalized(sql_query)
+        # Callers may mutate the result, so each one gets its own copy of the cached query
+        return _copy_query(_parse_shared(sql_query))
+
+    def _parse_normalized(self, sql_query: str) -> SQLQuery:
+        """Parse a stripped, ';'-terminated SQL query string"""
+        # INSERT and DELETE are parsed straight from the text, so recognise them
+        # by their leading keyword and skip the sqlparse tokenization they would never use
+        dml = _DML_PREFIX_RE.match(sql_query)
+        first_keyword = dml.group(1).upper() if dml is not None else ''
+        if first_keyword == 'INSERT':
+            query = SQLQuery(type=QueryType.INSERT)
+            self._parse_insert_query(sql_query, query)
+            return query
+        if first_keyword == 'DELETE':
+            query = SQLQuery(type=QueryType.DELETE)
+            self._parse_delete_query(sql_query, query)
+            return query
+
+        # Tokenize with the single-pass lexer (same tokens as sqlparse's lexer)
+        tokens = tokenize(sql_query)
 
         # Determine query type
-        query_type = self._get_query_type(parsed)
+        query_type = self._get_query_type(tokens)
 
         # Create SQLQuery object
         query = SQLQuery(type=query_type)
 
         # Parse based on query type
         if query_type == QueryType.SELECT:
-            self._parse_select_query(parsed, query)
+            self._parse_select_query(tokens, query)
         elif query_type == QueryType.INSERT:
-            self._parse_insert_query(parsed, query)
+            self._parse_insert_query(sql_query, query)
         elif query_type == QueryType.DELETE:
-            self._parse_delete_query(parsed, query)
+            self._parse_delete_query(sql_query, query)
         else:
             raise ValueError(f"Unsupported query type: {query_type}")
 
         return query
 
-    def _get_query_type(self, parsed: TokenList) -> QueryType:
+    def _get_query_type(self, tokens: List[Token]) -> QueryType:
         """Determine the type of SQL query"""
-        for token in parsed.tokens:
-            if token.ttype is DML:
-                keyword = token.value.upper()
+        # Only statement-level keywords count; a DML keyword inside parentheses
+        # belongs to a subquery
+        depth = 0
+        for token in tokens:
+            if token.value == '(':
+                depth += 1
+            elif token.value == ')':
+                depth -= 1
+            elif depth == 0 and token.ttype is DML:
+                keyword = token.normalized
                 if keyword == 'SELECT':
                     return QueryType.SELECT
                 elif keyword == 'INSERT':
@@ -79,46 +160,53 @@ class SQLParser:
                     return QueryType.UPDATE
         raise ValueError("Unable to determine query type")
 
-    def _parse_select_query(self, parsed: TokenList, query: SQLQuery):
+    def _parse_select_query(self, tokens: List[Token], query: SQLQuery) -> None:
         """Parse SELECT query components"""
         idx = 0
-        tokens = list(parsed.flatten())
+        # sqlparse already upper-cases keyword text while lexing (Token.normalized),
+        # so clause parsers compare against this list instead of calling .upper()
+        # on every token they visit
+        upper_tokens = [token.normalized for token in tokens]
 
         while idx < len(tokens):
             token = tokens[idx]
 
             # Skip whitespace and punctuation
-            if token.is_whitespace or str(token) in [',', ';', '(', ')']:
+            if token.is_whitespace or token.value in _SKIP_TOKENS:
                 idx += 1
                 continue
 
-            keyword = str(token).upper()
+            keyword = upper_tokens[idx]
+            if not token.is_keyword:
+                # Only keywords start a clause; anything else between clauses is skipped
+                idx += 1
+                continue
 
             if keyword == 'SELECT':
-                idx = self._parse_select_clause(tokens, idx + 1, query)
+                idx = self._parse_select_clause(tokens, upper_tokens, idx + 1, query)
             elif keyword == 'FROM':
-                idx = self._parse_from_clause(tokens, idx + 1, query)
+                idx = self._parse_from_clause(tokens, upper_tokens, idx + 1, query)
             elif keyword == 'WHERE':
-                idx = self._parse_where_clause(tokens, idx + 1, query)
-            elif keyword == 'GROUP BY' or (keyword == 'GROUP' and idx + 1 < len(tokens) and str(tokens[idx + 1]).upper() == 'BY'):
+                idx = self._parse_where_clause(tokens, upper_tokens, idx + 1, query)
+            elif keyword == 'GROUP BY' or (keyword == 'GROUP' and idx + 1 < len(tokens) and upper_tokens[idx + 1] == 'BY'):
                 # Handle both 'GROUP BY' as single token or 'GROUP' followed by 'BY'
                 if keyword == 'GROUP BY':
-                    idx = self._parse_group_by_clause(tokens, idx + 1, query)
+                    idx = self._parse_group_by_clause(tokens, upper_tokens, idx + 1, query)
                 else:
-                    idx = self._parse_group_by_clause(tokens, idx + 2, query)
+                    idx = self._parse_group_by_clause(tokens, upper_tokens, idx + 2, query)
             elif keyword == 'HAVING':
-                idx = self._parse_having_clause(tokens, idx + 1, query)
-            elif keyword == 'ORDER BY' or (keyword == 'ORDER' and idx + 1 < len(tokens) and str(tokens[idx + 1]).upper() == 'BY'):
+                idx = self._parse_having_clause(tokens, upper_tokens, idx + 1, query)
+            elif keyword == 'ORDER BY' or (keyword == 'ORDER' and idx + 1 < len(tokens) and upper_tokens[idx + 1] == 'BY'):
                 # Handle both 'ORDER BY' as single token or 'ORDER' followed by 'BY'
                 if keyword == 'ORDER BY':
-                    idx = self._parse_order_by_clause(tokens, idx + 1, query)
+                    idx = self._parse_order_by_clause(tokens, upper_tokens, idx + 1, query)
                 else:
-                    idx = self._parse_order_by_clause(tokens, idx + 2, query)
+                    idx = self._parse_order_by_clause(tokens, upper_tokens, idx + 2, query)
             elif keyword == 'LIMIT':
                 idx = self._parse_limit_clause(tokens, idx + 1, query)
             elif keyword == 'OFFSET':
                 idx = self._parse_offset_clause(tokens, idx + 1, query)
-            elif keyword in ['UNION', 'INTERSECT', 'EXCEPT']:
+            elif keyword in _COMBINATION_KEYWORDS:
                 # Handle combined queries
                 query.combination_type = CombinationType[keyword]
                 # For simplicity, we'll handle this in a separate method
@@ -126,7 +214,9 @@ class SQLParser:
             else:
                 idx += 1
 
-    def _parse_select_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_select_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse SELECT clause and extract attributes"""
         idx = start_idx
         current_attr: List[str] = []
@@ -134,11 +224,15 @@ class SQLParser:
 
         while idx < len(tokens):
             token = tokens[idx]
-            token_str = str(token).strip()
+            if token.is_whitespace:
+                # Whitespace never ends the clause or joins an item
+                idx += 1
+                continue
+            token_str = token.value
 
             # Check for end of SELECT clause - only if it's actually a keyword in this context
             # Don't end on "ORDER" if it's being used as a table/column name
-            if token_str.upper() == 'FROM' and paren_depth == 0:
+            if upper_tokens[idx] == 'FROM' and paren_depth == 0:
                 if current_attr:
                     self._add_attribute(current_attr, query)
                 return idx
@@ -155,7 +249,7 @@ class SQLParser:
                 if current_attr:
                     self._add_attribute(current_attr, query)
                     current_attr = []
-            elif not token.is_whitespace:
+            else:
                 current_attr.append(token_str)
 
             idx += 1
@@ -165,69 +259,74 @@ class SQLParser:
 
         return idx
 
-    def _add_attribute(self, attr_parts: List[str], query: SQLQuery):
+    def _add_attribute(self, attr_parts: List[str], query: SQLQuery) -> None:
         """Add parsed attribute to query"""
         attr_str = ' '.join(attr_parts)
 
-        # Handle alias (AS keyword) first
         alias = None
-        if ' AS ' in attr_str.upper() or ' as ' in attr_str:
-            parts = re.split(r'\s+[Aa][Ss]\s+', attr_str)
-            attr_str = parts[0].strip()
-            alias = parts[1].strip() if len(parts) > 1 else None
-
-        # Check for aggregate function
         aggregate = None
-        for agg_name, agg_enum in self.aggregate_map.items():
-            pattern = rf'{agg_name}\s*\(\s*([^)]+)\s*\)'
-            match = re.match(pattern, attr_str, re.IGNORECASE)
+        item_match = _AGG_ITEM_RE.fullmatch(attr_str)
+        if item_match:
+            # Aggregate item: function, column and alias in a single match
+            aggregate = self.aggregate_map[item_match.group('fn').upper()]
+            attr_str = item_match.group('arg')
+            alias = item_match.group('alias')
+        else:
+            # Handle alias (AS keyword) first
+            if ' AS ' in attr_str.upper() or ' as ' in attr_str:
+                parts = _AS_RE.split(attr_str)
+                attr_str = parts[0].strip()
+                alias = parts[1].strip() if len(parts) > 1 else None
+
+            # Check for aggregate function
+            match = _AGG_RE.match(attr_str)
             if match:
-                aggregate = agg_enum
+                aggregate = self.aggregate_map[match.group('fn').upper()]
                 # Extract the column from within the aggregate function
-                attr_str = match.group(1).strip()
-                break
+                attr_str = match.group('arg').strip()
 
         # Parse table.attribute format
-        if '.' in attr_str:
-            parts = attr_str.split('.')
-            relation = parts[0].strip()
-            name = parts[1].strip()
-        else:
-            # Single attribute without table prefix
-            relation = ""
-            name = attr_str.strip()
+        relation, name = self._split_qualified(attr_str)
 
         attribute = Attribute(
-            relation=relation,
-            name=name,
+            relation=_intern(relation),
+            name=_intern(name),
             alias=alias,
             aggregate=aggregate
         )
         query.select_attributes.append(attribute)
 
-    def _parse_from_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _split_qualified(self, attr_str: str) -> Tuple[str, str]:
+        """Split "table.column" into (table, column); unqualified names get an empty table"""
+        relation, sep, name = attr_str.partition('.')
+        if sep:
+            return relation.strip(), name.strip()
+        return "", attr_str.strip()
+
+    def _parse_from_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse FROM clause and extract tables"""
         idx = start_idx
         current_table: List[str] = []
 
         while idx < len(tokens):
             token = tokens[idx]
-            token_str = str(token).strip()
+            if token.is_whitespace:
+                # Whitespace never ends the clause or joins an item
+                idx += 1
+                continue
+            token_str = token.value
+            keyword = upper_tokens[idx]
 
             # Check for end of FROM clause - only check actual clause keywords
             # "ORDER" alone might be a table name, but "ORDER BY" is definitely a clause
-            if token_str.upper() == 'WHERE' or \
-               token_str.upper() == 'GROUP' or \
-               token_str.upper() == 'GROUP BY' or \
-               token_str.upper() == 'HAVING' or \
-               (token_str.upper() == 'ORDER' and idx + 1 < len(tokens) and str(tokens[idx + 1]).strip().upper() == 'BY') or \
-               token_str.upper() == 'ORDER BY' or \
-               token_str.upper() == 'LIMIT' or \
-               token_str == ';':
+            if keyword in _END_FROM or \
+               (keyword == 'ORDER' and idx + 1 < len(tokens) and upper_tokens[idx + 1] == 'BY'):
                 if current_table:
                     table_name = ' '.join(current_table).strip()
                     if table_name:
-                        query.from_tables.append(table_name)
+                        query.from_tables.append(_intern(table_name))
                 return idx
 
             # Handle comma separator
@@ -235,9 +334,9 @@ class SQLParser:
                 if current_table:
                     table_name = ' '.join(current_table).strip()
                     if table_name:
-                        query.from_tables.append(table_name)
+                        query.from_tables.append(_intern(table_name))
                     current_table = []
-            elif not token.is_whitespace:
+            else:
                 current_table.append(token_str)
 
             idx += 1
@@ -245,141 +344,181 @@ class SQLParser:
         if current_table:
             table_name = ' '.join(current_table).strip()
             if table_name:
-                query.from_tables.append(table_name)
+                query.from_tables.append(_intern(table_name))
 
         return idx
 
-    def _parse_where_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_where_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse WHERE clause and extract conditions"""
         idx = start_idx
-        condition_str = ""
+        # Collect fragments and join once instead of growing a string with +=
+        condition_parts: List[str] = []
 
         while idx < len(tokens):
             token = tokens[idx]
             token_str = str(token).strip()
+            keyword = upper_tokens[idx]
 
             # Check for end of WHERE clause - handle compound keywords
             # "ORDER" alone might be part of the condition, but "ORDER BY" is definitely a clause
-            if token_str.upper() in ['GROUP', 'GROUP BY', 'HAVING', 'LIMIT', 'UNION', 'INTERSECT', 'EXCEPT'] or \
-               (token_str.upper() == 'ORDER' and idx + 1 < len(tokens) and str(tokens[idx + 1]).strip().upper() == 'BY') or \
-               token_str.upper() == 'ORDER BY' or \
-               token_str == ';':
-                if condition_str:
-                    self._parse_conditions(condition_str.strip(), query)
+            if keyword in _END_WHERE or \
+               (keyword == 'ORDER' and idx + 1 < len(tokens) and upper_tokens[idx + 1] == 'BY'):
+                if condition_parts:
+                    self._parse_conditions(''.join(condition_parts).strip(), query)
                 return idx
 
             if not token.is_whitespace:
                 # Special handling for dots - don't add spaces around them
                 if token_str == '.':
-                    condition_str = condition_str.rstrip() + '.'
-                elif idx > 0 and condition_str and condition_str[-1] == '.':
-                    condition_str += token_str
+                    if condition_parts and condition_parts[-1] == ' ':
+                        condition_parts.pop()
+                    condition_parts.append('.')
+                elif condition_parts and condition_parts[-1][-1] == '.':
+                    condition_parts.append(token_str)
                 else:
-                    if condition_str and not condition_str[-1] in '(,':
-                        condition_str += ' '
-                    condition_str += token_str
+                    if condition_parts and condition_parts[-1][-1] not in '(,':
+                        condition_parts.append(' ')
+                    condition_parts.append(token_str)
 
             idx += 1
 
-        if condition_str:
-            self._parse_conditions(condition_str.strip(), query)
+        if condition_parts:
+            self._parse_conditions(''.join(condition_parts).strip(), query)
 
         return idx
 
-    def _parse_conditions(self, condition_str: str, query: SQLQuery):
+    def _split_top_level_and(self, condition_str: str) -> List[str]:
+        """
+        Split a condition string on AND, ignoring ANDs inside quotes or parentheses
+
+        Args:
+            condition_str: WHERE condition text
+
+        Returns:
+            Condition parts in order (AND and its surrounding whitespace removed)
+        """
+        upper = condition_str.upper()
+        length = len(condition_str)
+        parts: List[str] = []
+        start = 0
+        depth = 0
+        quote = ''
+        idx = 0
+
+        while idx < length:
+            char = condition_str[idx]
+            if quote:
+                if char == quote:
+                    quote = ''
+            elif char == "'" or char == '"':
+                quote = char
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif depth == 0 and char.isspace():
+                # Look for whitespace + AND + whitespace starting at this run
+                word_idx = idx + 1
+                while word_idx < length and condition_str[word_idx].isspace():
+                    word_idx += 1
+                after_idx = word_idx + 3
+                if (upper.startswith('AND', word_idx) and after_idx < length
+                        and condition_str[after_idx].isspace()):
+                    parts.append(condition_str[start:idx])
+                    while after_idx < length and condition_str[after_idx].isspace():
+                        after_idx += 1
+                    start = idx = after_idx
+                    continue
+                idx = word_idx
+                continue
+            idx += 1
+
+        parts.append(condition_str[start:])
+        return parts
+
+    def _parse_conditions(self, condition_str: str, query: SQLQuery) -> None:
         """Parse WHERE conditions and separate joins from filters"""
-        # Split by AND (simplified - real implementation would need proper parsing)
-        conditions = re.split(r'\s+AND\s+', condition_str, flags=re.IGNORECASE)
+        # Split by top-level AND; quoted literals and parenthesised groups stay intact
+        conditions = self._split_top_level_and(condition_str)
 
         for cond in conditions:
             cond = cond.strip()
             if not cond:
                 continue
 
-            # Check if it's a join condition (table1.attr = table2.attr)
-            join_match = re.match(
-                r'(\w+)\.(\w+)\s*(=)\s*(\w+)\.(\w+)',
-                cond,
-                re.IGNORECASE
-            )
+            match = _CONDITION_RE.match(cond)
+            if not match:
+                continue
 
-            if join_match:
-                # This is a join condition
-                left_table = join_match.group(1)
-                left_attr = join_match.group(2)
-                right_table = join_match.group(4)
-                right_attr = join_match.group(5)
+            if match.group('lt'):
+                # This is a join condition (table1.attr = table2.attr)
+                left_table = match.group('lt')
+                left_attr = match.group('la')
+                right_table = match.group('rt')
+                right_attr = match.group('ra')
 
                 join_cond = JoinCondition(
-                    left_operand=Attribute(relation=left_table, name=left_attr),
-                    right_operand=Attribute(relation=right_table, name=right_attr),
+                    left_operand=Attribute(
+                        relation=_intern(left_table), name=_intern(left_attr)
+                    ),
+                    right_operand=Attribute(
+                        relation=_intern(right_table), name=_intern(right_attr)
+                    ),
                     operator='='
                 )
                 query.join_conditions.append(join_cond)
+            elif match.group('expr'):
+                # This is an expression condition
+                expr_str = match.group('expr')  # e.g., "(price * stock)"
+                operator = match.group('expr_op')
+                value = match.group('expr_val').strip(' \t\r\n\'";')
+
+                # Store as a special WHERE condition with expression
+                where_cond = WhereCondition(
+                    attribute=Attribute(relation="", name=expr_str),
+                    operator=operator,
+                    value=value,
+                    is_join=False
+                )
+                query.where_conditions.append(where_cond)
             else:
-                # This is a regular WHERE condition
-                # First check for expression-based conditions (e.g., (price * stock) > 1000)
-                expr_match = re.match(
-                    r'(\([^)]+\))\s*([=<>!]+)\s*(.+)',
-                    cond,
-                    re.IGNORECASE
+                # Parse regular comparison: attribute operator value (including LIKE, IN, BETWEEN)
+                attr_str = match.group('attr')
+                operator = match.group('op')
+                value = match.group('val').strip(' \t\r\n\'";')
+
+                # Parse attribute
+                relation, name = self._split_qualified(attr_str)
+
+                where_cond = WhereCondition(
+                    attribute=Attribute(
+                        relation=_intern(relation), name=_intern(name)
+                    ),
+                    operator=operator,
+                    value=value,
+                    is_join=False
                 )
+                query.where_conditions.append(where_cond)
 
-                if expr_match:
-                    # This is an expression condition
-                    expr_str = expr_match.group(1)  # e.g., "(price * stock)"
-                    operator = expr_match.group(2)
-                    value = expr_match.group(3).strip().strip("'\"").rstrip(';')
-
-                    # Store as a special WHERE condition with expression
-                    where_cond = WhereCondition(
-                        attribute=Attribute(relation="", name=expr_str),
-                        operator=operator,
-                        value=value,
-                        is_join=False
-                    )
-                    query.where_conditions.append(where_cond)
-                else:
-                    # Parse regular comparison: attribute operator value (including LIKE, IN, BETWEEN)
-                    comp_match = re.match(
-                        r'([\w.]+)\s*([=<>!]+|LIKE|IN|BETWEEN|NOT\s+IN|NOT\s+BETWEEN)\s*(.+)',
-                        cond,
-                        re.IGNORECASE
-                    )
-
-                    if comp_match:
-                        attr_str = comp_match.group(1)
-                        operator = comp_match.group(2)
-                        value = comp_match.group(3).strip().strip("'\"").rstrip(';')
-
-                        # Parse attribute
-                        if '.' in attr_str:
-                            parts = attr_str.split('.')
-                            relation = parts[0]
-                            name = parts[1]
-                        else:
-                            relation = ""
-                            name = attr_str
-
-                        where_cond = WhereCondition(
-                            attribute=Attribute(relation=relation, name=name),
-                            operator=operator,
-                            value=value,
-                            is_join=False
-                        )
-                        query.where_conditions.append(where_cond)
-
-    def _parse_group_by_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_group_by_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse GROUP BY clause"""
         idx = start_idx
         current_attr: List[str] = []
 
         while idx < len(tokens):
             token = tokens[idx]
-            token_str = str(token).strip()
+            if token.is_whitespace:
+                # Whitespace never ends the clause or joins an item
+                idx += 1
+                continue
+            token_str = token.value
 
             # Check for end of GROUP BY clause - handle compound keywords
-            if token_str.upper() in ['HAVING', 'ORDER', 'ORDER BY', 'LIMIT', ';']:
+            if upper_tokens[idx] in _END_GROUP_BY:
                 if current_attr:
                     self._add_group_by_attribute(current_attr, query)
                 return idx
@@ -389,7 +528,7 @@ class SQLParser:
                 if current_attr:
                     self._add_group_by_attribute(current_attr, query)
                     current_attr = []
-            elif not token.is_whitespace:
+            else:
                 current_attr.append(token_str)
 
             idx += 1
@@ -399,22 +538,18 @@ class SQLParser:
 
         return idx
 
-    def _add_group_by_attribute(self, attr_parts: List[str], query: SQLQuery):
+    def _add_group_by_attribute(self, attr_parts: List[str], query: SQLQuery) -> None:
         """Add GROUP BY attribute to query"""
         attr_str = ' '.join(attr_parts)
 
-        if '.' in attr_str:
-            parts = attr_str.split('.')
-            relation = parts[0].strip()
-            name = parts[1].strip()
-        else:
-            relation = ""
-            name = attr_str.strip()
+        relation, name = self._split_qualified(attr_str)
 
-        attribute = Attribute(relation=relation, name=name)
+        attribute = Attribute(relation=_intern(relation), name=_intern(name))
         query.group_by.append(attribute)
 
-    def _parse_having_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_having_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse HAVING clause"""
         idx = start_idx
         condition_parts: List[str] = []
@@ -424,7 +559,7 @@ class SQLParser:
             token_str = str(token).strip()
 
             # Check for end of HAVING clause
-            if token_str.upper() in ['ORDER', 'LIMIT', ';']:
+            if upper_tokens[idx] in _END_HAVING:
                 if condition_parts:
                     self._parse_having_conditions(' '.join(condition_parts), query)
                 return idx
@@ -439,14 +574,10 @@ class SQLParser:
 
         return idx
 
-    def _parse_having_conditions(self, condition_str: str, query: SQLQuery):
+    def _parse_having_conditions(self, condition_str: str, query: SQLQuery) -> None:
         """Parse HAVING conditions"""
         # Parse aggregate conditions
-        match = re.match(
-            r'(\w+)\s*\(\s*([\w.]+)\s*\)\s*([=<>!]+)\s*(.+)',
-            condition_str,
-            re.IGNORECASE
-        )
+        match = _HAVING_RE.match(condition_str)
 
         if match:
             agg_func = match.group(1).upper()
@@ -455,18 +586,12 @@ class SQLParser:
             value = match.group(4).strip()
 
             # Parse attribute
-            if '.' in attr_str:
-                parts = attr_str.split('.')
-                relation = parts[0]
-                name = parts[1]
-            else:
-                relation = ""
-                name = attr_str
+            relation, name = self._split_qualified(attr_str)
 
             aggregate = self.aggregate_map.get(agg_func)
             attribute = Attribute(
-                relation=relation,
-                name=name,
+                relation=_intern(relation),
+                name=_intern(name),
                 aggregate=aggregate
             )
 
@@ -478,7 +603,9 @@ class SQLParser:
             )
             query.having.append(having_cond)
 
-    def _parse_order_by_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_order_by_clause(
+        self, tokens: List[Token], upper_tokens: List[str], start_idx: int, query: SQLQuery
+    ) -> int:
         """Parse ORDER BY clause"""
         idx = start_idx
         current_attr: List[str] = []
@@ -486,24 +613,28 @@ class SQLParser:
 
         while idx < len(tokens):
             token = tokens[idx]
-            token_str = str(token).strip().upper()
+            if token.is_whitespace:
+                # Whitespace never ends the clause or joins an item
+                idx += 1
+                continue
+            token_str = upper_tokens[idx]
 
             # Check for end of ORDER BY clause
-            if token_str in ['LIMIT', 'OFFSET', ';']:
+            if token_str in _END_ORDER_BY:
                 if current_attr:
                     self._add_order_by_attribute(current_attr, direction, query)
                 return idx
 
             # Check for direction
-            if token_str in ['ASC', 'DESC']:
+            if token_str in _ORDER_DIRECTIONS:
                 direction = token_str
             elif token_str == ',':
                 if current_attr:
                     self._add_order_by_attribute(current_attr, direction, query)
                     current_attr = []
                     direction = "ASC"
-            elif not tokens[idx].is_whitespace:
-                current_attr.append(str(tokens[idx]))
+            else:
+                current_attr.append(token.value)
 
             idx += 1
 
@@ -512,74 +643,178 @@ class SQLParser:
 
         return idx
 
-    def _add_order_by_attribute(self, attr_parts: List[str], direction: str, query: SQLQuery):
+    def _add_order_by_attribute(
+        self, attr_parts: List[str], direction: str, query: SQLQuery
+    ) -> None:
         """Add ORDER BY attribute to query"""
         attr_str = ' '.join(attr_parts).replace('ASC', '').replace('DESC', '').strip()
 
-        if '.' in attr_str:
-            parts = attr_str.split('.')
-            relation = parts[0].strip()
-            name = parts[1].strip()
-        else:
-            relation = ""
-            name = attr_str.strip()
+        relation, name = self._split_qualified(attr_str)
 
-        attribute = Attribute(relation=relation, name=name)
+        attribute = Attribute(relation=_intern(relation), name=_intern(name))
         query.order_by.append((attribute, direction))
 
-    def _parse_limit_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+    def _parse_limit_clause(self, tokens: List[Token], start_idx: int, query: SQLQuery) -> int:
         """Parse LIMIT clause"""
-        if start_idx < len(tokens):
-            token_str = str(tokens[start_idx]).strip()
-            if token_str.isdigit():
-                query.limit = int(token_str)
-                return start_idx + 1
-        return start_idx
-
-    def _parse_offset_clause(self, tokens: List, start_idx: int, query: SQLQuery) -> int:
+        idx = start_idx
+        while idx < len(tokens) and tokens[idx].is_whitespace:
+            idx += 1
+        if idx < len(tokens):
+            # Lexer tokens carry no surrounding whitespace, so the value converts directly
+            try:
+                query.limit = int(tokens[idx].value)
+                return idx + 1
+            except ValueError:
+                pass
+        return idx
+
+    def _parse_offset_clause(self, tokens: List[Token], start_idx: int, query: SQLQuery) -> int:
         """Parse OFFSET clause"""
-        if start_idx < len(tokens):
-            token_str = str(tokens[start_idx]).strip()
-            if token_str.isdigit():
-                query.offset = int(token_str)
-                return start_idx + 1
-        return start_idx
-
-    def _parse_insert_query(self, parsed: TokenList, query: SQLQuery):
+        idx = start_idx
+        while idx < len(tokens) and tokens[idx].is_whitespace:
+            idx += 1
+        if idx < len(tokens):
+            # Lexer tokens carry no surrounding whitespace, so the value converts directly
+            try:
+                query.offset = int(tokens[idx].value)
+                return idx + 1
+            except ValueError:
+                pass
+        return idx
+
+    def _parse_insert_query(self, query_str: str, query: SQLQuery) -> None:
         """Parse INSERT query"""
         # Extract INSERT INTO table_name (columns) VALUES (values)
-        query_str = str(parsed).strip()
+        parts = self._split_insert(query_str)
+        if parts is None:
+            raise ValueError(
+                "Malformed INSERT query: expected INSERT INTO table (...) VALUES (...)"
+            )
+        table, columns_str, values_str = parts
+
+        query.insert_table = _intern(table)
+
+        # Parse columns
+        columns = [col.strip() for col in columns_str.split(',')]
+
+        # Parse values
+        values = [val.strip(' \t\r\n\'"') for val in values_str.split(',')]
+
+        # Create insert values dictionary
+        for col, val in zip(columns, values):
+            query.insert_values[_intern(col)] = val
+
+    @staticmethod
+    def _split_insert(query_str: str) -> Optional[Tuple[str, str, str]]:
+        """Split an INSERT statement into its table, column list and value list text"""
+        # The statement shape is fixed, so locate its markers with anchored
+        # matches and plain string searches instead of one regex over the query
+        head = _INSERT_INTO_RE.match(query_str)
+        if head is None:
+            return None
+        cols_start = query_str.find('(', head.end())
+        cols_end = query_str.find(')', cols_start) if cols_start >= 0 else -1
+        values_kw = _VALUES_RE.search(query_str, cols_end) if cols_end >= 0 else None
+        if values_kw is None:
+            return None
+        vals_start = query_str.find('(', values_kw.end())
+        vals_end = query_str.find(')', vals_start) if vals_start >= 0 else -1
+        if vals_end < 0:
+            return None
+
+        table = query_str[head.end():cols_start].strip()
+        columns_str = query_str[cols_start + 1:cols_end]
+        values_str = query_str[vals_start + 1:vals_end]
+        if not table.replace('_', '').isalnum() or \
+           query_str[cols_end + 1:values_kw.start()].strip() or \
+           query_str[values_kw.end():vals_start].strip() or \
+           not columns_str or not values_str:
+            return None
+        return table, columns_str, values_str
+
+    def _parse_delete_query(self, query_str: str, query: SQLQuery) -> None:
+        """Parse DELETE query"""
+        # Extract DELETE FROM table_name [WHERE conditions]
+        head = _DELETE_FROM_RE.match(query_str)
+        parts = query_str[head.end():].split(None, 1) if head is not None else []
 
-        # Match INSERT pattern
-        pattern = r'INSERT\s+INTO\s+(\w+)\s*\(([^)]+)\)\s*VALUES\s*\(([^)]+)\)'
-        match = re.match(pattern, query_str, re.IGNORECASE)
+        # Table name runs up to the first non-word character (e.g. ';')
+        table = parts[0] if parts else ''
+        end = 0
+        while end < len(table) and (table[end].isalnum() or table[end] == '_'):
+            end += 1
+        table = table[:end]
+        if not table:
+            raise ValueError("Malformed DELETE query: expected DELETE FROM table [WHERE ...]")
 
-        if match:
-            query.insert_table = match.group(1)
+        table = _intern(table)
+        query.delete_table = table
+        query.from_tables = [table]
 
-            # Parse columns
-            columns = [col.strip() for col in match.group(2).split(',')]
+        # Parse WHERE conditions if present
+        tail = parts[1] if len(parts) > 1 and end == len(parts[0]) else ''
+        where = _WHERE_PREFIX_RE.match(tail)
+        if where is not None:
+            conditions = tail[where.end():].strip()
+            if conditions:
+                self._parse_conditions(conditions, query)
 
-            # Parse values
-            values = [val.strip().strip("'\"") for val in match.group(3).split(',')]
 
-            # Create insert values dictionary
-            for col, val in zip(columns, values):
-                query.insert_values[col] = val
+# Repeated query strings reuse the SQLQuery built the first time, across all parsers.
+# SQLParser keeps no per-instance state that a parse depends on, so the cache is keyed
+# on the text alone and holds no reference to the parsers using it.
+_SHARED_PARSER = SQLParser()
 
-    def _parse_delete_query(self, parsed: TokenList, query: SQLQuery):
-        """Parse DELETE query"""
-        query_str = str(parsed).strip()
 
-        # Match DELETE FROM pattern
-        pattern = r'DELETE\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+))?'
-        match = re.match(pattern, query_str, re.IGNORECASE)
+@functools.lru_cache(maxsize=512)
+def _parse_shared(sql_query: str) -> SQLQuery:
+    """Parse a stripped, ';'-terminated query once; the result is shared, so do not mutate"""
+    return _SHARED_PARSER._parse_normalized(sql_query)
 
-        if match:
-            query.delete_table = match.group(1)
-            if query.delete_table:
-                query.from_tables = [query.delete_table]
 
-            # Parse WHERE conditions if present
-            if match.group(2):
-                self._parse_conditions(match.group(2), query)
+def _copy_attribute(attribute: Attribute) -> Attribute:
+    """Copy an Attribute; its fields are immutable"""
+    return Attribute(attribute.relation, attribute.name, attribute.alias, attribute.aggregate)
+
+
+def _copy_condition(condition: WhereCondition) -> WhereCondition:
+    """Copy a WhereCondition; its value is the literal text, which is immutable"""
+    return WhereCondition(
+        _copy_attribute(condition.attribute), condition.operator, condition.value,
+        condition.is_join,
+    )
+
+
+def _copy_query(query: SQLQuery) -> SQLQuery:
+    """
+    Copy a cached SQLQuery for one caller
+
+    Only the model objects and containers are rebuilt; names, operators, literal
+    text and enums are immutable and shared. This is an order of magnitude
+    cheaper than copy.deepcopy, which costs about as much as parsing the query
+    again.
+    """
+    return SQLQuery(
+        type=query.type,
+        select_attributes=[_copy_attribute(attr) for attr in query.select_attributes],
+        from_tables=list(query.from_tables),
+        where_conditions=[_copy_condition(cond) for cond in query.where_conditions],
+        join_conditions=[
+            JoinCondition(
+                _copy_attribute(join.left_operand), _copy_attribute(join.right_operand),
+                join.operator,
+            )
+            for join in query.join_conditions
+        ],
+        group_by=[_copy_attribute(attr) for attr in query.group_by],
+        having=[_copy_condition(cond) for cond in query.having],
+        order_by=[(_copy_attribute(attr), direction) for attr, direction in query.order_by],
+        limit=query.limit,
+        offset=query.offset,
+        insert_table=query.insert_table,
+        insert_values=dict(query.insert_values),
+        delete_table=query.delete_table,
+        combination_type=query.combination_type,
+        left_query=_copy_query(query.left_query) if query.left_query is not None else None,
+        right_query=_copy_query(query.right_query) if query.right_query is not None else None,
+    )
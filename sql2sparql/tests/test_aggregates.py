@@ -13,12 +13,14 @@ from rdflib import Graph
 class TestAggregateFunctions(unittest.TestCase):
     """Test suite for aggregate function conversion"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.graph = Graph()
-        self.schema_mapper = SchemaMapper(self.graph)
-        self.converter = SQL2SPARQLConverter(self.schema_mapper)
-        self.parser = SQLParser()
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
+        cls.graph = Graph()
+        cls.schema_mapper = SchemaMapper(cls.graph)
+        # Variables are numbered per query, so one converter serves every test
+        cls.converter = SQL2SPARQLConverter(cls.schema_mapper)
+        cls.parser = SQLParser()
 
     def test_count_all(self):
         """Test COUNT(*) conversion"""
@@ -12,12 +12,19 @@ from rdflib import Graph
 class TestCalculatedColumns(unittest.TestCase):
     """Test suite for calculated columns in SQL2SPARQL conversion"""
 
-    def setUp(self):
-        """Set up test fixtures"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
         # Create a simple RDF graph
-        self.graph = Graph()
-        self.schema_mapper = SchemaMapper(self.graph)
-        self.converter = SQL2SPARQLConverter(self.schema_mapper)
+        cls.graph = Graph()
+        cls.schema_mapper = SchemaMapper(cls.graph)
+        # Variables are numbered per query, so one converter serves every test
+        cls.converter = SQL2SPARQLConverter(cls.schema_mapper)
+
+    def assertContainsAll(self, haystack, needles):
+        """Assert that every needle occurs in haystack, reporting all that are missing"""
+        missing = [needle for needle in needles if needle not in haystack]
+        self.assertFalse(missing, f"Missing from output: {missing}")
 
     def test_simple_calculated_column(self):
         """Test simple calculated column conversion"""
@@ -25,30 +32,38 @@ class TestCalculatedColumns(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Check that SPARQL contains the calculation
-        self.assertIn("?price * ?stock", sparql)
-        self.assertIn("AS ?inventory_value", sparql)
+        self.assertContainsAll(sparql, [
+            "?price * ?stock",
+            "AS ?inventory_value",
+        ])
         # Check triple patterns are generated
-        self.assertIn("?product <http://example.org/ontology/name> ?name", sparql)
-        self.assertIn("?product <http://example.org/ontology/price> ?price", sparql)
-        self.assertIn("?product <http://example.org/ontology/stock> ?stock", sparql)
+        self.assertContainsAll(sparql, [
+            "?product <http://example.org/ontology/name> ?name",
+            "?product <http://example.org/ontology/price> ?price",
+            "?product <http://example.org/ontology/stock> ?stock",
+        ])
 
     def test_calculated_column_with_literal(self):
         """Test calculated column with literal value"""
         sql = "SELECT name, price * 1.1 AS price_with_tax FROM product"
         sparql = self.converter.convert(sql)
 
-        self.assertIn("?price * 1.1", sparql)
-        self.assertIn("AS ?price_with_tax", sparql)
+        self.assertContainsAll(sparql, [
+            "?price * 1.1",
+            "AS ?price_with_tax",
+        ])
 
     def test_multiple_calculated_columns(self):
         """Test multiple calculated columns in one query"""
         sql = "SELECT name, price * 1.1 AS price_with_tax, stock - 5 AS adjusted_stock FROM product"
         sparql = self.converter.convert(sql)
 
-        self.assertIn("?price * 1.1", sparql)
-        self.assertIn("AS ?price_with_tax", sparql)
-        self.assertIn("?stock - 5", sparql)
-        self.assertIn("AS ?adjusted_stock", sparql)
+        self.assertContainsAll(sparql, [
+            "?price * 1.1",
+            "AS ?price_with_tax",
+            "?stock - 5",
+            "AS ?adjusted_stock",
+        ])
 
     def test_calculated_column_in_where(self):
         """Test calculated column in WHERE clause"""
@@ -58,8 +73,10 @@ class TestCalculatedColumns(unittest.TestCase):
         # Check the filter is created
         self.assertIn("FILTER((?price * ?stock) > 1000)", sparql)
         # Check triple patterns exist (subject variable name may vary)
-        self.assertIn("<http://example.org/ontology/price> ?price", sparql)
-        self.assertIn("<http://example.org/ontology/stock> ?stock", sparql)
+        self.assertContainsAll(sparql, [
+            "<http://example.org/ontology/price> ?price",
+            "<http://example.org/ontology/stock> ?stock",
+        ])
 
     def test_complex_calculation(self):
         """Test complex calculation with multiple operators"""
@@ -69,8 +86,10 @@ class TestCalculatedColumns(unittest.TestCase):
         # Should contain the complex expression
         self.assertIn("AS ?half_value", sparql)
         # Check that variables are created
-        self.assertIn("?price", sparql)
-        self.assertIn("?stock", sparql)
+        self.assertContainsAll(sparql, [
+            "?price",
+            "?stock",
+        ])
 
     def test_calculated_with_table_prefix(self):
         """Test calculated column with table prefixes"""
@@ -78,32 +97,40 @@ class TestCalculatedColumns(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Should handle table prefixes
-        self.assertIn("?product_price * ?product_stock", sparql)
-        self.assertIn("AS ?value", sparql)
+        self.assertContainsAll(sparql, [
+            "?product_price * ?product_stock",
+            "AS ?value",
+        ])
 
     def test_addition_calculation(self):
         """Test addition in calculated column"""
         sql = "SELECT name, price + 50 AS increased_price FROM product"
         sparql = self.converter.convert(sql)
 
-        self.assertIn("?price + 50", sparql)
-        self.assertIn("AS ?increased_price", sparql)
+        self.assertContainsAll(sparql, [
+            "?price + 50",
+            "AS ?increased_price",
+        ])
 
     def test_subtraction_calculation(self):
         """Test subtraction in calculated column"""
         sql = "SELECT name, stock - 10 AS reduced_stock FROM product"
         sparql = self.converter.convert(sql)
 
-        self.assertIn("?stock - 10", sparql)
-        self.assertIn("AS ?reduced_stock", sparql)
+        self.assertContainsAll(sparql, [
+            "?stock - 10",
+            "AS ?reduced_stock",
+        ])
 
     def test_division_calculation(self):
         """Test division in calculated column"""
         sql = "SELECT name, price / 2 AS half_price FROM product"
         sparql = self.converter.convert(sql)
 
-        self.assertIn("?price / 2", sparql)
-        self.assertIn("AS ?half_price", sparql)
+        self.assertContainsAll(sparql, [
+            "?price / 2",
+            "AS ?half_price",
+        ])
 
     def test_parenthesized_calculation(self):
         """Test calculation with parentheses"""
@@ -111,9 +138,11 @@ class TestCalculatedColumns(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Should preserve the calculation structure
-        self.assertIn("AS ?adjusted_value", sparql)
-        self.assertIn("?price", sparql)
-        self.assertIn("?stock", sparql)
+        self.assertContainsAll(sparql, [
+            "AS ?adjusted_value",
+            "?price",
+            "?stock",
+        ])
 
     def test_no_alias_calculated_column(self):
         """Test calculated column without explicit alias"""
@@ -121,9 +150,21 @@ class TestCalculatedColumns(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Should generate an automatic alias
-        self.assertIn("?price * ?stock", sparql)
-        self.assertIn("AS ?calc_", sparql)
+        self.assertContainsAll(sparql, [
+            "?price * ?stock",
+            "AS ?calc_",
+        ])
+
+
+    def test_unaliased_calculated_columns_get_distinct_aliases(self):
+        """Test that each unaliased calculated column gets its own alias"""
+        sql = "SELECT price * stock, price + stock FROM product"
+        sparql = self.converter.convert(sql)
 
+        self.assertContainsAll(sparql, [
+            "(?price * ?stock) AS ?calc_1",
+            "(?price + ?stock) AS ?calc_2",
+        ])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
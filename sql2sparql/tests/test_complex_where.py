@@ -12,11 +12,13 @@ from rdflib import Graph
 class TestComplexWhere(unittest.TestCase):
     """Test suite for complex WHERE clause conversion"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.graph = Graph()
-        self.schema_mapper = SchemaMapper(self.graph)
-        self.converter = SQL2SPARQLConverter(self.schema_mapper)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
+        cls.graph = Graph()
+        cls.schema_mapper = SchemaMapper(cls.graph)
+        # Variables are numbered per query, so one converter serves every test
+        cls.converter = SQL2SPARQLConverter(cls.schema_mapper)
 
     def test_simple_and_condition(self):
         """Test WHERE with AND condition"""
@@ -40,17 +42,16 @@ class TestComplexWhere(unittest.TestCase):
         sql = "SELECT name FROM product WHERE category = 'Electronics' AND price < 500 OR stock > 20"
         sparql = self.converter.convert(sql)
 
-        # Should handle the precedence correctly
-        self.assertIn('FILTER(?category = "Electronics")', sparql)
-        self.assertIn('FILTER(?price < 500 || ?stock > 20)', sparql)
+        # AND binds tighter than OR: (category AND price) OR stock
+        self.assertIn('FILTER((?category = "Electronics" && ?price < 500) || ?stock > 20)', sparql)
 
     def test_like_operator(self):
         """Test LIKE operator conversion"""
         sql = "SELECT name FROM client WHERE email LIKE '%example.com'"
         sparql = self.converter.convert(sql)
 
-        # Should convert to regex
-        self.assertIn('regex(?email, ".*example.com", "i")', sparql)
+        # A suffix pattern needs no regex
+        self.assertIn('STRENDS(LCASE(?email), "example.com")', sparql)
 
     def test_like_with_underscore(self):
         """Test LIKE operator with underscore wildcard"""
@@ -58,23 +59,21 @@ class TestComplexWhere(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Should convert _ to . in regex
-        self.assertIn('regex(?name, "J.hn", "i")', sparql)
+        self.assertIn('regex(?name, "^J.hn$", "i")', sparql)
 
     def test_in_operator(self):
-        """Test IN operator conversion"""
-        sql = "SELECT name FROM product WHERE category IN ('Electronics', 'Furniture')"
-        sparql = self.converter.convert(sql)
-
-        # Should convert to SPARQL IN
-        self.assertIn('FILTER(?category IN ("Electronics", "Furniture"))', sparql)
-
-    def test_in_with_numbers(self):
-        """Test IN operator with numeric values"""
-        sql = "SELECT name FROM product WHERE price IN (100, 200, 300)"
-        sparql = self.converter.convert(sql)
-
-        # Should handle numeric values without quotes
-        self.assertIn('FILTER(?price IN (100, 200, 300))', sparql)
+        """Test IN operator conversion with string and numeric values"""
+        cases = [
+            # Strings are quoted
+            ("SELECT name FROM product WHERE category IN ('Electronics', 'Furniture')",
+             'FILTER(?category IN ("Electronics", "Furniture"))'),
+            # Numeric values stay unquoted
+            ("SELECT name FROM product WHERE price IN (100, 200, 300)",
+             'FILTER(?price IN (100, 200, 300))'),
+        ]
+        for sql, expected in cases:
+            with self.subTest(sql=sql):
+                self.assertIn(expected, self.converter.convert(sql))
 
     def test_between_operator(self):
         """Test BETWEEN operator conversion"""
@@ -86,30 +85,21 @@ class TestComplexWhere(unittest.TestCase):
 
     def test_not_equal_operator(self):
         """Test != and <> operators"""
-        sql1 = "SELECT name FROM product WHERE category != 'Electronics'"
-        sparql1 = self.converter.convert(sql1)
-        self.assertIn('FILTER(?category != "Electronics")', sparql1)
-
-        sql2 = "SELECT name FROM product WHERE category <> 'Electronics'"
-        sparql2 = self.converter.convert(sql2)
-        self.assertIn('FILTER(?category != "Electronics")', sparql2)
+        for operator in ('!=', '<>'):
+            with self.subTest(operator=operator):
+                sql = f"SELECT name FROM product WHERE category {operator} 'Electronics'"
+                self.assertIn('FILTER(?category != "Electronics")', self.converter.convert(sql))
 
     def test_comparison_operators(self):
         """Test various comparison operators"""
-        # Greater than
-        sql = "SELECT name FROM product WHERE price > 100"
-        sparql = self.converter.convert(sql)
-        self.assertIn('FILTER(?price > 100)', sparql)
-
-        # Less than or equal
-        sql = "SELECT name FROM product WHERE stock <= 10"
-        sparql = self.converter.convert(sql)
-        self.assertIn('FILTER(?stock <= 10)', sparql)
-
-        # Greater than or equal
-        sql = "SELECT name FROM product WHERE price >= 50"
-        sparql = self.converter.convert(sql)
-        self.assertIn('FILTER(?price >= 50)', sparql)
+        cases = [
+            ("SELECT name FROM product WHERE price > 100", 'FILTER(?price > 100)'),
+            ("SELECT name FROM product WHERE stock <= 10", 'FILTER(?stock <= 10)'),
+            ("SELECT name FROM product WHERE price >= 50", 'FILTER(?price >= 50)'),
+        ]
+        for sql, expected in cases:
+            with self.subTest(sql=sql):
+                self.assertIn(expected, self.converter.convert(sql))
 
     def test_complex_nested_conditions(self):
         """Test complex nested conditions"""
@@ -119,7 +109,11 @@ class TestComplexWhere(unittest.TestCase):
         sparql = self.converter.convert(sql)
 
         # Should handle the grouping correctly
-        self.assertIn('FILTER', sparql)
+        self.assertIn(
+            'FILTER((?category = "Electronics" && ?price < 500) || '
+            '(?category = "Furniture" && ?stock > 10))',
+            sparql,
+        )
 
     def test_calculated_expression_in_where(self):
         """Test calculated expression in WHERE clause"""
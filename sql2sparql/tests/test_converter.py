@@ -2,6 +2,12 @@
 Comprehensive tests for SQL2SPARQL converter
 Based on examples from the paper
 """
+import gc
+import hashlib
+import os
+import pickle
+import weakref
+
 import pytest
 from rdflib import Graph, Namespace, Literal, URIRef, RDF
 
@@ -9,12 +15,12 @@ from sql2sparql.core.converter import SQL2SPARQLConverter
 from sql2sparql.core.schema_mapper import SchemaMapper
 from sql2sparql.parsers.sql_parser import SQLParser
 from sql2sparql.core.models import QueryType, AggregateFunction
-from sql2sparql.executors.sparql_executor import SPARQLExecutor, StoreType
+from sql2sparql.executors.sparql_executor import SPARQLExecutor, StoreType, _prepare_query
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rdf_data():
-    """Create sample RDF data for testing"""
+    """Create sample RDF data for testing (shared by the session; tests must not modify it)"""
     graph = Graph()
 
     # Define namespaces
@@ -22,54 +28,101 @@ def sample_rdf_data():
     ont = Namespace("http://example.org/ontology/")
     types = Namespace("http://example.org/types/")
 
+    triples = []
+
     # Add sample data - Clients
     client1 = ex.client1
-    graph.add((client1, RDF.type, types.Client))
-    graph.add((client1, ont.name, Literal("John Doe")))
-    graph.add((client1, ont.email, Literal("john@example.com")))
-    graph.add((client1, ont.age, Literal(30)))
+    triples += [
+        (client1, RDF.type, types.Client),
+        (client1, ont.name, Literal("John Doe")),
+        (client1, ont.email, Literal("john@example.com")),
+        (client1, ont.age, Literal(30)),
+    ]
 
     client2 = ex.client2
-    graph.add((client2, RDF.type, types.Client))
-    graph.add((client2, ont.name, Literal("Jane Smith")))
-    graph.add((client2, ont.email, Literal("jane@example.com")))
-    graph.add((client2, ont.age, Literal(25)))
+    triples += [
+        (client2, RDF.type, types.Client),
+        (client2, ont.name, Literal("Jane Smith")),
+        (client2, ont.email, Literal("jane@example.com")),
+        (client2, ont.age, Literal(25)),
+    ]
 
     # Add sample data - Orders
     order1 = ex.order1
-    graph.add((order1, RDF.type, types.Order))
-    graph.add((order1, ont.date, Literal("2024-01-15")))
-    graph.add((order1, ont.total, Literal(150.00)))
-    graph.add((order1, ont.client, client1))
+    triples += [
+        (order1, RDF.type, types.Order),
+        (order1, ont.date, Literal("2024-01-15")),
+        (order1, ont.total, Literal(150.00)),
+        (order1, ont.client, client1),
+    ]
 
     order2 = ex.order2
-    graph.add((order2, RDF.type, types.Order))
-    graph.add((order2, ont.date, Literal("2024-01-20")))
-    graph.add((order2, ont.total, Literal(250.00)))
-    graph.add((order2, ont.client, client2))
+    triples += [
+        (order2, RDF.type, types.Order),
+        (order2, ont.date, Literal("2024-01-20")),
+        (order2, ont.total, Literal(250.00)),
+        (order2, ont.client, client2),
+    ]
 
     # Add sample data - Products
     product1 = ex.product1
-    graph.add((product1, RDF.type, types.Product))
-    graph.add((product1, ont.name, Literal("Laptop")))
-    graph.add((product1, ont.price, Literal(1200.00)))
-    graph.add((product1, ont.category, Literal("Electronics")))
+    triples += [
+        (product1, RDF.type, types.Product),
+        (product1, ont.name, Literal("Laptop")),
+        (product1, ont.price, Literal(1200.00)),
+        (product1, ont.category, Literal("Electronics")),
+    ]
 
     product2 = ex.product2
-    graph.add((product2, RDF.type, types.Product))
-    graph.add((product2, ont.name, Literal("Book")))
-    graph.add((product2, ont.price, Literal(25.00)))
-    graph.add((product2, ont.category, Literal("Books")))
-
+    triples += [
+        (product2, RDF.type, types.Product),
+        (product2, ont.name, Literal("Book")),
+        (product2, ont.price, Literal(25.00)),
+        (product2, ont.category, Literal("Books")),
+    ]
+
+    # One batched addN call instead of a Python-level add() per triple
+    graph.addN((s, p, o, graph) for s, p, o in triples)
     return graph
 
 
-@pytest.fixture
-def converter_with_schema(sample_rdf_data):
-    """Create converter with schema extracted from sample data"""
+@pytest.fixture(scope="session")
+def schema_mapper_with_schema(request, sample_rdf_data):
+    """Create schema mapper with schema extracted from sample data"""
     schema_mapper = SchemaMapper(sample_rdf_data)
-    schema_mapper.extract_schema()
-    return SQL2SPARQLConverter(schema_mapper)
+
+    # Keep the extracted schema in pytest's cache directory, keyed by the graph
+    # contents, so later runs load it instead of extracting it again
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        schema_mapper.extract_schema()
+        return schema_mapper
+
+    triples = sorted(sample_rdf_data.serialize(format="nt").splitlines())
+    key = hashlib.sha256("\n".join(triples).encode()).hexdigest()
+    cache_file = cache.mkdir("sql2sparql") / f"schema_{key}.pkl"
+    if cache_file.exists():
+        schema_mapper.load_schema(pickle.loads(cache_file.read_bytes()))
+    else:
+        schema_mapper.extract_schema()
+        # Parallel workers may race here, so write under a private name and rename
+        partial_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+        partial_file.write_bytes(pickle.dumps(schema_mapper.schema))
+        partial_file.replace(cache_file)
+    return schema_mapper
+
+
+@pytest.fixture(scope="session")
+def converter_with_schema(schema_mapper_with_schema):
+    """Create converter with schema extracted from sample data"""
+    # Variables are numbered per query, so one converter serves every test
+    return SQL2SPARQLConverter(schema_mapper_with_schema)
+
+
+@pytest.fixture(scope="session")
+def rdflib_executor(sample_rdf_data):
+    """Create an in-memory executor over the sample data (for read-only queries)"""
+    return SPARQLExecutor(store_type=StoreType.RDFLIB, graph=sample_rdf_data)
 
 
 class TestSQLParser:
@@ -99,6 +152,16 @@ class TestSQLParser:
         assert result.where_conditions[0].operator == ">"
         assert result.where_conditions[0].value == "25"
 
+    def test_parse_where_and_inside_literal(self):
+        """Test that AND inside a quoted value does not split the condition"""
+        parser = SQLParser()
+        query = "SELECT name FROM product WHERE name = 'a AND b' AND price > 10"
+        result = parser.parse(query)
+
+        assert len(result.where_conditions) == 2
+        assert result.where_conditions[0].value == "a AND b"
+        assert result.where_conditions[1].attribute.name == "price"
+
     def test_parse_join_query(self):
         """Test parsing JOIN query"""
         parser = SQLParser()
@@ -156,6 +219,15 @@ class TestSQLParser:
         assert result.order_by[0][0].name == "price"
         assert result.order_by[0][1] == "DESC"
 
+    def test_parse_limit_offset_query(self):
+        """Test parsing LIMIT and OFFSET clauses"""
+        parser = SQLParser()
+        query = "SELECT name FROM product ORDER BY price LIMIT 10 OFFSET 5"
+        result = parser.parse(query)
+
+        assert result.limit == 10
+        assert result.offset == 5
+
     def test_parse_insert_query(self):
         """Test parsing INSERT query"""
         parser = SQLParser()
@@ -178,6 +250,95 @@ class TestSQLParser:
         assert len(result.where_conditions) == 1
         assert result.where_conditions[0].attribute.name == "age"
 
+    def test_parse_insert_delete_with_non_ascii_names(self):
+        """Test INSERT/DELETE parsing when upper-casing would change the text length"""
+        parser = SQLParser()
+
+        result = parser.parse("insert into straße (maß, city) values ('ß', 'Köln')")
+        assert result.insert_table == "straße"
+        assert result.insert_values == {"maß": "ß", "city": "Köln"}
+
+        result = parser.parse("delete from straße where maß = 'ß'")
+        assert result.delete_table == "straße"
+        assert result.where_conditions[0].attribute.name == "maß"
+
+    def test_parse_rejects_malformed_insert_delete(self):
+        """Test that words starting with INSERT/DELETE and malformed DML are rejected"""
+        parser = SQLParser()
+
+        for query in ["Inserting rows into client", "Deleted FROM client",
+                      "INSERT client VALUES ('Bob')", "DELETE client WHERE age < 18"]:
+            with pytest.raises(ValueError):
+                parser.parse(query)
+
+        with pytest.raises(ValueError):
+            SQL2SPARQLConverter().convert("Deleted FROM client")
+
+    def test_identifiers_are_interned(self):
+        """Test that repeated table/column names share one string object"""
+        parser = SQLParser()
+        first = parser.parse("SELECT client.name FROM client WHERE client.age > 25")
+        second = parser.parse("SELECT client.name FROM client GROUP BY client.name")
+
+        assert first.select_attributes[0].relation is second.select_attributes[0].relation
+        assert first.select_attributes[0].name is second.group_by[0].name
+        assert first.where_conditions[0].attribute.relation is second.group_by[0].relation
+        assert first.from_tables[0] is second.from_tables[0]
+
+    def test_parse_empty_query(self):
+        """Test that an empty or blank query is rejected"""
+        parser = SQLParser()
+
+        with pytest.raises(ValueError):
+            parser.parse("   \n ")
+
+    def test_repeated_parse_returns_independent_copies(self):
+        """Test that parsing the same query twice does not share mutable state"""
+        parser = SQLParser()
+        query = "SELECT name FROM client WHERE age > 25"
+        first = parser.parse(query)
+        first.select_attributes.clear()
+        second = parser.parse(query + "  ")
+
+        assert first is not second
+        assert len(second.select_attributes) == 1
+        assert second.where_conditions[0].value == "25"
+
+    def test_cached_parse_is_a_full_copy(self):
+        """Test that cache hits equal a fresh parse and share no model objects"""
+        parser = SQLParser()
+        queries = [
+            "SELECT c.name FROM client c, orders o WHERE c.id = o.client_id AND o.total > 100",
+            "SELECT category, COUNT(name) FROM product GROUP BY category HAVING COUNT(name) > 5",
+            "SELECT name FROM client ORDER BY name DESC LIMIT 10 OFFSET 5",
+            "INSERT INTO client (name, email) VALUES ('Bob', 'bob@example.com')",
+        ]
+        for query in queries:
+            first = parser.parse(query)
+            second = parser.parse(query)
+            assert first == second == SQLParser()._parse_normalized(query + ";")
+
+            for attribute in (
+                [join.left_operand for join in first.join_conditions]
+                + [cond.attribute for cond in first.where_conditions + first.having]
+                + first.group_by + [attr for attr, _ in first.order_by]
+            ):
+                attribute.name = "changed"
+            first.insert_values.clear()
+            assert second == parser.parse(query)
+
+    def test_parse_cache_keeps_no_parser_alive(self):
+        """Test that parsers are freed by reference counting once unused"""
+        gc.disable()
+        try:
+            parser = SQLParser()
+            parser.parse("SELECT name FROM client WHERE age > 25")
+            parser_ref = weakref.ref(parser)
+            del parser
+            assert parser_ref() is None
+        finally:
+            gc.enable()
+
 
 class TestSchemaMapper:
     """Test schema extraction functionality"""
@@ -207,6 +368,80 @@ class TestSchemaMapper:
         assert mapper.validate_sql_reference("client", "invalid") == False
         assert mapper.validate_sql_reference("invalid", "name") == False
 
+    def test_load_schema(self, sample_rdf_data):
+        """Test reusing a previously extracted schema"""
+        schema = SchemaMapper(sample_rdf_data).extract_schema()
+        mapper = SchemaMapper(sample_rdf_data)
+        mapper.load_schema(schema)
+
+        assert mapper.schema_version == 1
+        assert mapper.get_schema_info() is schema.tables
+        assert mapper.validate_sql_reference("client", "email") == True
+
+    def test_column_and_table_lookups(self, sample_rdf_data):
+        """Test resolving columns and tables to the URIs used in the graph"""
+        mapper = SchemaMapper(sample_rdf_data)
+
+        assert mapper.get_column_property("email") == "http://example.org/ontology/email"
+        assert mapper.get_table_class("client") == "http://example.org/types/Client"
+        # Unknown names fall back to the default namespaces
+        assert mapper.get_column_property("nickname") == "http://example.org/ontology/nickname"
+        assert mapper.get_table_class("invoice") == "http://example.org/types/Invoice"
+
+    def test_lookups_follow_loaded_data(self):
+        """Test that loading more RDF data refreshes the lookups"""
+        mapper = SchemaMapper(Graph())
+        assert mapper.get_column_property("label") == "http://example.org/ontology/label"
+
+        mapper.load_rdf_string(
+            '<http://example.org/p1> <http://www.w3.org/2000/01/rdf-schema#label> "x" .',
+            format="nt",
+        )
+        assert mapper.get_column_property("label") == "http://www.w3.org/2000/01/rdf-schema#label"
+
+    def test_lookup_collisions_pick_smallest_uri(self):
+        """Test that colliding local names resolve the same way whatever the graph order"""
+        graph = Graph()
+        subject = URIRef("http://example.org/s1")
+        for base in ["http://z.example/", "http://a.example/", "http://m.example/"]:
+            graph.add((subject, URIRef(base + "name"), Literal("x")))
+            graph.add((subject, RDF.type, URIRef(base + "Client")))
+        mapper = SchemaMapper(graph)
+
+        assert mapper.get_column_property("name") == "http://a.example/name"
+        assert mapper.get_table_class("client") == "http://a.example/Client"
+
+    def test_lookups_follow_direct_graph_changes(self):
+        """Test that triples added to the graph directly are picked up"""
+        graph = Graph()
+        mapper = SchemaMapper(graph)
+        assert mapper.get_table_class("client") == "http://example.org/types/Client"
+
+        client = URIRef("http://example.org/c1")
+        graph.add((client, RDF.type, URIRef("http://example.org/crm/Client")))
+        assert mapper.get_table_class("client") == "http://example.org/crm/Client"
+
+        # Swapping a triple keeps the graph size, so it has to be announced
+        graph.remove((client, RDF.type, None))
+        graph.add((client, RDF.type, URIRef("http://example.org/erp/Client")))
+        version = mapper.schema_version
+        mapper.invalidate_cache()
+        assert mapper.schema_version == version + 1
+        assert mapper.get_table_class("client") == "http://example.org/erp/Client"
+
+    def test_converter_follows_direct_graph_changes(self):
+        """Test that cached conversions are dropped when the graph is edited directly"""
+        graph = Graph()
+        mapper = SchemaMapper(graph)
+        converter = SQL2SPARQLConverter(mapper)
+        sql = "SELECT name FROM product WHERE price > 5"
+        assert "<http://example.org/ontology/price>" in converter.convert(sql)
+
+        graph.add((URIRef("http://a.org/p1"), URIRef("http://a.org/price"), Literal(10)))
+        sparql = converter.convert(sql)
+        assert "<http://a.org/price>" in sparql
+        assert sparql == SQL2SPARQLConverter(mapper).convert(sql)
+
 
 class TestSQL2SPARQLConverter:
     """Test main converter functionality"""
@@ -287,14 +522,137 @@ class TestSQL2SPARQLConverter:
         assert "FILTER" in sparql
         assert "< 18" in sparql
 
+    def test_repeated_conversion_is_cached(self):
+        """Test that repeated queries reuse the cached conversion until the schema changes"""
+        schema_mapper = SchemaMapper(Graph())
+        converter = SQL2SPARQLConverter(schema_mapper)
+        sql = "SELECT name, price * 2 AS double_price FROM product"
+
+        first = converter.convert(sql)
+        assert converter.convert("  " + sql + "\n") == first
+        assert converter._convert_cached.cache_info().hits == 1
+
+        schema_mapper.extract_schema()
+        converter.convert(sql)
+        assert converter._convert_cached.cache_info().misses == 2
+
+    def test_cache_key_ignores_layout_outside_literals(self):
+        """Test that reformatted queries share a cache entry but literals stay distinct"""
+        converter = SQL2SPARQLConverter()
+
+        converter.convert("SELECT name FROM client WHERE age > 25")
+        converter.convert("SELECT name\n    FROM client\n    WHERE  age > 25")
+        assert converter._convert_cached.cache_info().hits == 1
+
+        converter.convert("SELECT name FROM client WHERE city = 'New  York'")
+        converter.convert("SELECT name FROM client WHERE city = 'New York'")
+        assert converter._convert_cached.cache_info().misses == 3
+
+        converter.invalidate_cache()
+        assert converter._convert_cached.cache_info().currsize == 0
+
+    def test_comments_do_not_swallow_clauses(self):
+        """Test that a line comment ends at its line break, not at the end of the query"""
+        converter = SQL2SPARQLConverter()
+
+        sparql = converter.convert("SELECT name FROM product -- all products\nWHERE price > 5")
+        assert "FILTER(?price > 5)" in sparql
+        assert converter.convert("SELECT name FROM product /* all */ WHERE price > 5") == sparql
+
+        compiled = converter.prepare("SELECT name FROM product -- any?\nWHERE price > ?")
+        assert compiled.execute([5]) == sparql
+
+        sparql = converter.convert("SELECT name FROM client WHERE city = 'a -- b'")
+        assert 'FILTER(?city = "a -- b")' in sparql
+
+    def test_recurring_query_shape_is_specialized(self):
+        """Test that queries differing only in integer literals share a SPARQL template"""
+        converter = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        reference = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        template = "SELECT name, price * 2 AS doubled FROM product WHERE stock <= {} LIMIT {}"
+
+        for stock in range(1, 8):
+            sql = template.format(stock, stock + 10)
+            assert converter.convert(sql) == reference._convert_uncached(sql)
+
+        templates = list(converter._shape_templates.values())
+        assert len(templates) == 1 and templates[0] is not None
+
+        # Zero is kept in the shape rather than filled into the template
+        sql = template.format(0, 10)
+        assert converter.convert(sql) == reference._convert_uncached(sql)
+        assert len(converter._shape_templates) == 1
+
+    def test_predicate_iris_are_shared(self):
+        """Test that separate conversions reuse one string per predicate IRI"""
+        parsed = SQLParser().parse("SELECT name FROM product WHERE price > 10")
+        first = SQL2SPARQLConverter()._convert_query(parsed)
+        second = SQL2SPARQLConverter()._convert_query(parsed)
+
+        assert first.where_patterns[0].predicate == "<http://example.org/ontology/name>"
+        for left, right in zip(first.where_patterns, second.where_patterns):
+            assert left.predicate is right.predicate
+
+    def test_convert_many_matches_convert(self):
+        """Test that batch conversion returns one result per query, in order"""
+        converter = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        reference = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        queries = [
+            "SELECT name FROM client WHERE age > 25",
+            "SELECT category, COUNT(*) FROM product GROUP BY category",
+            "SELECT name FROM client WHERE age > 25",
+        ]
+
+        results = converter.convert_many(queries)
+
+        assert results == [reference.convert(sql) for sql in queries]
+        assert converter._convert_cached.cache_info().hits == 1
+
+    def test_conversion_does_not_depend_on_earlier_queries(self):
+        """Test that a reused converter numbers variables from scratch for every query"""
+        converter = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        sql = "SELECT x.a, y.b FROM x, y WHERE x.id = y.xid AND y.v >= 3"
+
+        converter.convert("SELECT product.name FROM product WHERE product.price > 100")
+        assert converter.convert(sql) == SQL2SPARQLConverter(SchemaMapper(Graph())).convert(sql)
+
+    def test_prepared_query_matches_convert(self):
+        """Test that prepared queries give the same SPARQL as converting the filled-in SQL"""
+        converter = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        reference = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        prepared = converter.prepare(
+            "SELECT name, price * 2 AS doubled FROM product "
+            "WHERE stock <= ? AND category = ? LIMIT ?"
+        )
+
+        assert prepared.parameter_count == 3
+        assert prepared.template is not None
+        for params, sql in [
+            ((7, 3, 20), "stock <= 7 AND category = 3 LIMIT 20"),
+            ((7, "Books", 20), "stock <= 7 AND category = 'Books' LIMIT 20"),
+            ((0.5, "a?b", 1), "stock <= 0.5 AND category = 'a?b' LIMIT 1"),
+        ]:
+            expected = reference.convert(
+                f"SELECT name, price * 2 AS doubled FROM product WHERE {sql}"
+            )
+            assert prepared.execute(params) == expected
+
+        with pytest.raises(ValueError):
+            prepared.execute((1, 2))
+
+    def test_insert_conversion_is_not_cached(self):
+        """Test that each INSERT conversion mints a new subject"""
+        converter = SQL2SPARQLConverter(SchemaMapper(Graph()))
+        sql = "INSERT INTO client (name) VALUES ('Alice')"
+
+        assert converter.convert(sql) != converter.convert(sql)
+
 
 class TestSPARQLExecutor:
     """Test SPARQL execution functionality"""
 
-    def test_execute_select(self, sample_rdf_data):
+    def test_execute_select(self, rdflib_executor):
         """Test executing SELECT query"""
-        executor = SPARQLExecutor(store_type=StoreType.RDFLIB, graph=sample_rdf_data)
-
         query = """
         SELECT ?name ?email
         WHERE {
@@ -304,14 +662,12 @@ class TestSPARQLExecutor:
         }
         """
 
-        results = executor.execute_query(query)
+        results = rdflib_executor.execute_query(query)
         assert len(results) == 2
         assert all("name" in r and "email" in r for r in results)
 
-    def test_execute_with_filter(self, sample_rdf_data):
+    def test_execute_with_filter(self, rdflib_executor):
         """Test executing query with FILTER"""
-        executor = SPARQLExecutor(store_type=StoreType.RDFLIB, graph=sample_rdf_data)
-
         query = """
         SELECT ?name
         WHERE {
@@ -322,15 +678,34 @@ class TestSPARQLExecutor:
         }
         """
 
-        results = executor.execute_query(query)
+        results = rdflib_executor.execute_query(query)
         assert len(results) == 1
         assert results[0]["name"] == "John Doe"
 
-    def test_get_statistics(self, sample_rdf_data):
-        """Test getting store statistics"""
+    def test_repeated_select_reuses_prepared_query(self, sample_rdf_data):
+        """Test that a repeated SELECT is parsed once and gives the same rows"""
         executor = SPARQLExecutor(store_type=StoreType.RDFLIB, graph=sample_rdf_data)
 
-        stats = executor.get_statistics()
+        query = """
+        SELECT ?name ((?price * 2) AS ?double_price)
+        WHERE {
+            ?s <http://example.org/ontology/name> ?name .
+            ?s <http://example.org/ontology/price> ?price .
+            FILTER(?price * 2 > 100)
+        }
+        """
+
+        first = executor.execute_query(query)
+        hits = _prepare_query.cache_info().hits
+        second = executor.execute_query(query)
+
+        assert _prepare_query.cache_info().hits == hits + 1
+        assert second == first
+        assert [r["name"] for r in first] == ["Laptop"]
+
+    def test_get_statistics(self, rdflib_executor):
+        """Test getting store statistics"""
+        stats = rdflib_executor.get_statistics()
         assert "total_triples" in stats
         assert stats["total_triples"] > 0
         assert "distinct_subjects" in stats
@@ -340,7 +715,7 @@ class TestSPARQLExecutor:
 class TestEndToEnd:
     """End-to-end integration tests"""
 
-    def test_complete_workflow(self, sample_rdf_data):
+    def test_complete_workflow(self, sample_rdf_data, rdflib_executor):
         """Test complete workflow from SQL to results"""
         # Extract schema
         schema_mapper = SchemaMapper(sample_rdf_data)
@@ -354,8 +729,7 @@ class TestEndToEnd:
         sparql = converter.convert(sql)
 
         # Execute SPARQL
-        executor = SPARQLExecutor(store_type=StoreType.RDFLIB, graph=sample_rdf_data)
-        results = executor.execute_query(sparql)
+        results = rdflib_executor.execute_query(sparql)
 
         # Verify results
         assert len(results) == 1
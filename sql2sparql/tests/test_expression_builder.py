@@ -3,6 +3,7 @@
 Unit tests for ExpressionBuilder class
 """
 
+import dataclasses
 import unittest
 from sql2sparql.core.converter import ExpressionBuilder, ExpressionNode
 
@@ -70,8 +71,32 @@ class TestExpressionBuilder(unittest.TestCase):
         expr = "price * stock + 100"
         node = self.builder.parse_expression(expr)
         self.assertEqual(node.type, 'operator')
-        # Due to left-to-right parsing, + should be root
+        # + binds more loosely than *, so it should be root
         self.assertEqual(node.value, '+')
+        self.assertEqual(node.left.value, '*')
+        self.assertEqual(node.right.value, '100')
+
+    def test_parse_left_associative_operators(self):
+        """Test that chained operators of equal precedence group to the left"""
+        node = self.builder.parse_expression("stock - 5 - 2")
+        sparql = self.builder.to_sparql_expression(node, self.var_mappings)
+        self.assertEqual(sparql, "((?stock - 5) - 2)")
+
+        node = self.builder.parse_expression("price / 2 * stock")
+        sparql = self.builder.to_sparql_expression(node, self.var_mappings)
+        self.assertEqual(sparql, "((?price / 2) * ?stock)")
+
+    def test_parse_multiple_parenthesized_groups(self):
+        """Test expressions with more than one parenthesized group"""
+        node = self.builder.parse_expression("(price + 10) * (stock - 1)")
+        sparql = self.builder.to_sparql_expression(node, self.var_mappings)
+        self.assertEqual(sparql, "((?price + 10) * (?stock - 1))")
+
+    def test_parse_negative_numbers(self):
+        """Test signed numeric literals"""
+        node = self.builder.parse_expression("price * -2")
+        self.assertEqual(node.right.type, 'literal')
+        self.assertEqual(node.right.value, '-2')
 
     def test_to_sparql_simple(self):
         """Test converting simple expression to SPARQL"""
@@ -94,6 +119,13 @@ class TestExpressionBuilder(unittest.TestCase):
         sparql = self.builder.to_sparql_expression(node, self.var_mappings)
         self.assertEqual(sparql, "(?product_price * 2)")
 
+    def test_to_sparql_resolves_unqualified_columns(self):
+        """Test that unqualified columns fall back to the first table-qualified mapping"""
+        var_mappings = {'o.total': '?o1', 'p.price': '?o2', 'q.price': '?o3'}
+        node = self.builder.parse_expression("price * total + discount")
+        sparql = self.builder.to_sparql_expression(node, var_mappings)
+        self.assertEqual(sparql, "((?o2 * ?o1) + ?discount)")
+
     def test_parse_function_call(self):
         """Test parsing function calls"""
         expr = "COUNT(price)"
@@ -137,6 +169,16 @@ class TestExpressionBuilder(unittest.TestCase):
         self.assertIn('1.1', sparql)
         self.assertIn('2', sparql)
 
+    def test_parse_results_are_cached(self):
+        """Test that repeated parses share one read-only tree"""
+        ExpressionBuilder.parse_expression.cache_clear()
+        node = self.builder.parse_expression("(price + 10) * stock")
+
+        self.assertIs(ExpressionBuilder().parse_expression("(price + 10) * stock"), node)
+        self.assertEqual(ExpressionBuilder.parse_expression.cache_info().hits, 1)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            node.value = '+'
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-pass SQL lexer
+"""
+
+import unittest
+from sqlparse import keywords, lexer
+from sqlparse import tokens as T
+from sql2sparql.parsers.fast_lexer import tokenize
+
+
+def sqlparse_tokens(sql):
+    """Reference token stream from sqlparse's lexer, up to the first ';'"""
+    result = []
+    for ttype, value in lexer.tokenize(sql):
+        result.append((ttype, value))
+        if value == ';':
+            break
+    return result
+
+
+class TestFastLexer(unittest.TestCase):
+    """Test that the fast lexer matches sqlparse's lexer token for token"""
+
+    def assertSameTokens(self, sql):
+        tokens = [(token.ttype, token.value) for token in tokenize(sql)]
+        self.assertEqual(tokens, sqlparse_tokens(sql))
+
+    def test_simple_select(self):
+        """Test keywords, names, punctuation and whitespace"""
+        self.assertSameTokens("SELECT name, email FROM client WHERE age > 25;")
+
+    def test_qualified_names_and_functions(self):
+        """Test table.column names and function calls"""
+        self.assertSameTokens(
+            "select c.name, COUNT(*) AS n, sum (o.total) from client c "
+            "left outer join orders o on c.id = o.client_id group by c.name;"
+        )
+
+    def test_literals_and_operators(self):
+        """Test strings, numbers and multi-word operators"""
+        self.assertSameTokens(
+            "SELECT * FROM product WHERE name NOT LIKE 'a''b%' AND price >= -1.5e3 "
+            "AND stock <> 0 AND x IS NOT NULL ORDER BY price DESC NULLS LAST;"
+        )
+
+    def test_comments_and_newlines(self):
+        """Test line and block comments and CRLF line endings"""
+        self.assertSameTokens("SELECT a -- first\r\nFROM t /* note */ WHERE b = 1;")
+
+    def test_stops_after_first_statement(self):
+        """Test that only the first statement is tokenized"""
+        tokens = tokenize("SELECT a FROM t; SELECT b FROM u;")
+        self.assertEqual(tokens[-1].value, ';')
+        self.assertNotIn('u', [token.value for token in tokens])
+
+    def test_customized_default_lexer_is_respected(self):
+        """Test that rules set on sqlparse's default lexer are used instead of the fast path"""
+        default_lexer = lexer.Lexer.get_default_instance()
+        original_rules = default_lexer._SQL_REGEX
+        default_lexer.set_SQL_REGEX([(r'ZAP\b', T.Keyword)] + list(keywords.SQL_REGEX))
+        try:
+            self.assertSameTokens("SELECT zap FROM t;")
+            self.assertIn((T.Keyword, 'zap'),
+                          [(token.ttype, token.value) for token in tokenize("SELECT zap FROM t;")])
+        finally:
+            default_lexer._SQL_REGEX = original_rules
+
+
+if __name__ == '__main__':
+    unittest.main()
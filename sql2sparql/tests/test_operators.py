@@ -6,17 +6,25 @@ Unit tests for BETWEEN and IN operators
 import unittest
 from sql2sparql.core.converter import SQL2SPARQLConverter
 from sql2sparql.core.schema_mapper import SchemaMapper
+from sql2sparql.converters.where_converter import WhereConverter
+from sql2sparql.utils.sparql_text import canonicalize_sparql
 from rdflib import Graph
 
 
 class TestOperators(unittest.TestCase):
     """Test suite for special SQL operators (BETWEEN, IN, etc.)"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.graph = Graph()
-        self.schema_mapper = SchemaMapper(self.graph)
-        self.converter = SQL2SPARQLConverter(self.schema_mapper)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
+        cls.graph = Graph()
+        cls.schema_mapper = SchemaMapper(cls.graph)
+        # Variables are numbered per query, so one converter serves every test
+        cls.converter = SQL2SPARQLConverter(cls.schema_mapper)
+
+    def assertSPARQLEqual(self, sparql, expected):
+        """Assert two SPARQL queries are equal up to layout and pattern order"""
+        self.assertEqual(canonicalize_sparql(sparql), canonicalize_sparql(expected))
 
     # BETWEEN operator tests
     def test_between_numeric_values(self):
@@ -59,16 +67,12 @@ class TestOperators(unittest.TestCase):
         self.assertIn('FILTER(?product_price >= 50 && ?product_price <= 300)', sparql)
 
     def test_not_between(self):
-        """Test NOT BETWEEN (if supported)"""
+        """Test NOT BETWEEN"""
         sql = "SELECT name FROM product WHERE price NOT BETWEEN 50 AND 300"
-        # This might need special handling
-        try:
-            sparql = self.converter.convert(sql)
-            # Should negate the condition
-            self.assertIsNotNone(sparql)
-        except:
-            # If not supported, at least document it
-            pass
+        sparql = self.converter.convert(sql)
+
+        # Should negate the range
+        self.assertIn('FILTER(?price < 50 || ?price > 300)', sparql)
 
     # IN operator tests
     def test_in_with_strings(self):
@@ -99,15 +103,53 @@ class TestOperators(unittest.TestCase):
 
         self.assertIn('FILTER(?category IN ("Electronics"))', sparql)
 
+    def test_in_with_commas_inside_strings(self):
+        """Test IN values that contain commas stay whole"""
+        sql = "SELECT name FROM product WHERE category IN ('Home, Garden', 'Toys')"
+        sparql = self.converter.convert(sql)
+
+        self.assertIn('FILTER(?category IN ("Home, Garden", "Toys"))', sparql)
+
+    def test_in_with_quotes_and_backslashes(self):
+        """Test IN string items are unescaped from SQL and escaped for SPARQL"""
+        sql = "SELECT name FROM product WHERE name IN ('a''b', 'say \"hi\"', 'C:\\dir')"
+        sparql = self.converter.convert(sql)
+
+        self.assertIn('FILTER(?name IN ("a\'b", "say \\"hi\\"", "C:\\\\dir"))', sparql)
+
+    def test_comparison_with_quotes_and_backslashes(self):
+        """Test plain comparison strings are unescaped from SQL and escaped for SPARQL"""
+        sparql = self.converter.convert("SELECT name FROM product WHERE category = 'a\"b'")
+        self.assertIn('FILTER(?category = "a\\"b")', sparql)
+
+        sparql = self.converter.convert("SELECT name FROM client WHERE name = 'O''Brien'")
+        self.assertIn('FILTER(?name = "O\'Brien")', sparql)
+
+        sparql = self.converter.convert("SELECT name FROM client WHERE path = 'C:\\dir'")
+        self.assertIn('FILTER(?path = "C:\\\\dir")', sparql)
+
     def test_not_in(self):
         """Test NOT IN operator"""
         sql = "SELECT name FROM product WHERE category NOT IN ('Electronics', 'Furniture')"
-        # This might need special handling
-        try:
-            sparql = self.converter.convert(sql)
-            self.assertIsNotNone(sparql)
-        except:
-            pass
+        sparql = self.converter.convert(sql)
+
+        self.assertIn('FILTER(!(?category IN ("Electronics", "Furniture")))', sparql)
+
+    def test_negated_operand_kept_in_or(self):
+        """Test NOT IN / NOT LIKE operands of an OR are rendered, not dropped"""
+        sql = "SELECT name FROM product WHERE price > 5 OR category NOT IN ('a')"
+        sparql = self.converter.convert(sql)
+        self.assertIn('FILTER(?price > 5 || !(?category IN ("a")))', sparql)
+
+        sql = "SELECT name FROM product WHERE name NOT LIKE 'A%' OR price > 5"
+        sparql = self.converter.convert(sql)
+        self.assertIn('FILTER(!(STRSTARTS(LCASE(?name), "a")) || ?price > 5)', sparql)
+
+    def test_unsupported_operand_in_or_raises(self):
+        """Test an OR operand that cannot be translated raises instead of being dropped"""
+        sql = "SELECT name FROM product WHERE price > 5 OR category SIMILAR TO 'a'"
+        with self.assertRaises(ValueError):
+            self.converter.convert(sql)
 
     def test_in_with_table_prefix(self):
         """Test IN with table-qualified column"""
@@ -152,21 +194,77 @@ class TestOperators(unittest.TestCase):
         sql = "SELECT name FROM client WHERE email LIKE '%@example.com'"
         sparql = self.converter.convert(sql)
 
-        self.assertIn('regex(?email, ".*@example.com", "i")', sparql)
+        self.assertSPARQLEqual(sparql, """
+            SELECT ?o0
+            WHERE {
+              ?s0 <http://example.org/ontology/name> ?o0 .
+              ?s0 <http://example.org/ontology/email> ?email .
+              FILTER(STRENDS(LCASE(?email), "@example.com"))
+            }""")
 
     def test_like_with_underscore(self):
         """Test LIKE with _ wildcard"""
         sql = "SELECT name FROM client WHERE code LIKE 'A_B'"
         sparql = self.converter.convert(sql)
 
-        self.assertIn('regex(?code, "A.B", "i")', sparql)
+        self.assertSPARQLEqual(sparql, """
+            SELECT ?o0
+            WHERE {
+              ?s0 <http://example.org/ontology/name> ?o0 .
+              ?s0 <http://example.org/ontology/code> ?code .
+              FILTER(regex(?code, "^A.B$", "i"))
+            }""")
 
     def test_like_with_both_wildcards(self):
         """Test LIKE with both wildcards"""
         sql = "SELECT name FROM product WHERE description LIKE '%quality_product%'"
         sparql = self.converter.convert(sql)
 
-        self.assertIn('regex(?description, ".*quality.product.*", "i")', sparql)
+        self.assertSPARQLEqual(sparql, """
+            SELECT ?o0
+            WHERE {
+              ?s0 <http://example.org/ontology/description> ?description .
+              ?s0 <http://example.org/ontology/name> ?o0 .
+              FILTER(regex(?description, "^.*quality.product.*$", "i"))
+            }""")
+
+    def test_like_prefix_and_substring(self):
+        """Test LIKE prefix/substring patterns use string functions instead of regex"""
+        self.assertEqual(WhereConverter.build_like_filter('?category', 'Elec%'),
+                         'STRSTARTS(LCASE(?category), "elec")')
+        self.assertEqual(WhereConverter.build_like_filter('?name', '%Lap%'),
+                         'CONTAINS(LCASE(?name), "lap")')
+
+    def test_like_interior_wildcard_uses_regex(self):
+        """Test LIKE patterns with interior wildcards fall back to regex"""
+        self.assertEqual(WhereConverter.build_like_filter('?name', 'J%n'),
+                         'regex(?name, "^J.*n$", "i")')
+
+    def test_like_regex_escapes_metacharacters(self):
+        """Test that regex metacharacters in a LIKE pattern match literally"""
+        self.assertEqual(WhereConverter.build_like_filter('?host', 'www.%.com'),
+                         'regex(?host, "^www\\\\..*\\\\.com$", "i")')
+
+    def test_like_escapes_quotes_and_backslashes(self):
+        """Test that quotes and backslashes in a LIKE pattern give valid SPARQL strings"""
+        self.assertEqual(WhereConverter.build_like_filter('?name', '%a"b%'),
+                         'CONTAINS(LCASE(?name), "a\\"b")')
+        self.assertEqual(WhereConverter.build_like_filter('?path', 'C:\\dir%'),
+                         'STRSTARTS(LCASE(?path), "c:\\\\dir")')
+        self.assertEqual(WhereConverter.build_like_filter('?name', "%O''Brien%"),
+                         'CONTAINS(LCASE(?name), "o\'brien")')
+        self.assertEqual(WhereConverter.build_like_filter('?name', "O''_%"),
+                         'regex(?name, "^O\'..*$", "i")')
+
+    def test_like_regex_matches_whole_value(self):
+        """Test that LIKE patterns without a leading or trailing % are anchored"""
+        self.assertEqual(WhereConverter.build_like_filter('?name', 'abc'),
+                         'regex(?name, "^abc$", "i")')
+        self.assertEqual(WhereConverter.build_like_filter('?code', 'A_B%'),
+                         'regex(?code, "^A.B.*$", "i")')
+
+        sparql = self.converter.convert("DELETE FROM client WHERE code LIKE 'A_B'")
+        self.assertIn('FILTER(regex(?code_del, "^A.B$", "i"))', sparql)
 
 
 if __name__ == '__main__':
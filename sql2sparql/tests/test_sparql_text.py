@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SPARQL text canonicalization
+"""
+
+import unittest
+from sql2sparql.utils.sparql_text import canonicalize_sparql
+
+
+class TestCanonicalizeSparql(unittest.TestCase):
+    """Test that equivalent SPARQL layouts canonicalize to the same text"""
+
+    def test_layout_is_normalized(self):
+        """Test that indentation and repeated spaces are collapsed"""
+        self.assertEqual(
+            canonicalize_sparql("SELECT  ?a\n    WHERE {\n\n  ?s   <p> ?a .\n}\n"),
+            "SELECT ?a\nWHERE {\n?s <p> ?a .\n}",
+        )
+
+    def test_patterns_and_filters_are_sorted(self):
+        """Test that pattern and FILTER order within a block does not matter"""
+        first = "WHERE {\n  ?s <q> ?b .\n  ?s <p> ?a .\n  FILTER(?b > 1)\n  FILTER(?a > 2)\n}"
+        second = "WHERE {\n  FILTER(?a > 2)\n  ?s <p> ?a .\n  FILTER(?b > 1)\n  ?s <q> ?b .\n}"
+        self.assertEqual(canonicalize_sparql(first), canonicalize_sparql(second))
+
+    def test_literals_are_preserved(self):
+        """Test that whitespace inside quoted literals is kept"""
+        self.assertEqual(
+            canonicalize_sparql('FILTER(?city = "New  York")'),
+            'FILTER(?city = "New  York")',
+        )
+
+    def test_clause_order_is_kept(self):
+        """Test that lines outside pattern runs keep their order"""
+        self.assertNotEqual(
+            canonicalize_sparql("SELECT ?a\nORDER BY ?a\nLIMIT 5"),
+            canonicalize_sparql("SELECT ?a\nLIMIT 5\nORDER BY ?a"),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
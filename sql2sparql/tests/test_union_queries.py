@@ -12,11 +12,13 @@ from rdflib import Graph
 class TestUnionQueries(unittest.TestCase):
     """Test suite for UNION query conversion"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.graph = Graph()
-        self.schema_mapper = SchemaMapper(self.graph)
-        self.converter = SQL2SPARQLConverter(self.schema_mapper)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test"""
+        cls.graph = Graph()
+        cls.schema_mapper = SchemaMapper(cls.graph)
+        # Variables are numbered per query, so one converter serves every test
+        cls.converter = SQL2SPARQLConverter(cls.schema_mapper)
 
     def test_simple_union(self):
         """Test simple UNION of two SELECT queries"""
@@ -151,6 +153,22 @@ class TestUnionQueries(unittest.TestCase):
         self.assertIn('UNION', sparql)
         # Should handle parentheses correctly
 
+    def test_union_between_parentheses_without_spaces(self):
+        """Test UNION written directly against parenthesized queries"""
+        sql = "(SELECT name FROM client)UNION(SELECT name FROM product)"
+        sparql = self.converter.convert(sql)
+
+        self.assertEqual(sparql.count('UNION'), 1)
+        self.assertEqual(sparql.count('{'), 3)
+
+    def test_union_inside_identifier_is_not_a_union(self):
+        """Test that identifiers containing 'union' are not split"""
+        sql = "SELECT name FROM reunion"
+        sparql = self.converter.convert(sql)
+
+        self.assertNotIn('UNION', sparql)
+        self.assertIn('?s0 <http://example.org/ontology/name> ?o0', sparql)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
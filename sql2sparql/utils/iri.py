@@ -0,0 +1,29 @@
+"""
+IRI helpers shared by the converters
+"""
+import sys
+from typing import Dict
+
+# The same few predicate and class IRIs are emitted on every conversion, so each
+# bracketed form is built and interned once. The table is bounded because names
+# come from user SQL.
+_IRI_REFS: Dict[str, str] = {}
+_IRI_REFS_LIMIT = 4096
+
+
+def iri_ref(uri: str) -> str:
+    """
+    Wrap a URI in angle brackets for use in a SPARQL pattern
+
+    Args:
+        uri: Absolute URI
+
+    Returns:
+        Interned "<uri>" string
+    """
+    ref = _IRI_REFS.get(uri)
+    if ref is None:
+        if len(_IRI_REFS) >= _IRI_REFS_LIMIT:
+            _IRI_REFS.clear()
+        ref = _IRI_REFS[uri] = sys.intern(f"<{uri}>")
+    return ref
@@ -0,0 +1,19 @@
+"""
+Literal helpers shared by the converters
+"""
+
+# Characters that must be escaped inside a double-quoted SPARQL string literal
+_SPARQL_STRING_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+
+def sparql_string(sql_text: str) -> str:
+    """
+    Render the contents of a SQL string literal as a SPARQL string literal
+
+    Args:
+        sql_text: Text between the quotes of a SQL literal, quotes still doubled ('')
+
+    Returns:
+        Double-quoted SPARQL string with backslashes and double quotes escaped
+    """
+    return '"' + sql_text.replace("''", "'").translate(_SPARQL_STRING_TABLE) + '"'
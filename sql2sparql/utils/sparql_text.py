@@ -0,0 +1,40 @@
+"""
+Helpers for comparing generated SPARQL text
+"""
+import re
+from typing import List
+
+# Quoted literals are matched so that whitespace inside them is left alone
+_LINE_WHITESPACE_RE = re.compile(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')|\s+")
+
+
+def canonicalize_sparql(sparql: str) -> str:
+    """
+    Normalize SPARQL text so that equivalent layouts compare equal
+
+    Each line is stripped and its whitespace runs outside quoted literals are
+    collapsed to one space. Within a group graph pattern, consecutive triple
+    patterns and FILTER lines are sorted, since their order does not change the
+    query's meaning. Expects one pattern or clause per line, as the converter
+    emits them.
+
+    Args:
+        sparql: SPARQL query string
+
+    Returns:
+        Canonical SPARQL query string
+    """
+    lines: List[str] = []
+    run: List[str] = []
+    for line in sparql.splitlines():
+        line = _LINE_WHITESPACE_RE.sub(lambda m: m.group(1) or ' ', line).strip()
+        if not line:
+            continue
+        if line.endswith(' .') or line.startswith('FILTER('):
+            run.append(line)
+            continue
+        lines.extend(sorted(run))
+        run = []
+        lines.append(line)
+    lines.extend(sorted(run))
+    return '\n'.join(lines)